@@ -5,7 +5,7 @@
  */
 
 import { EditorContext, getEditorContext } from './context';
-import type { UpdateResult, TabOrderItem, CellRange } from './types';
+import type { UpdateResult, TabOrderItem, CellRange, CellUpdate, ColumnBulkUpdates } from './types';
 
 // Import services
 import * as workbookService from './services/workbook';
@@ -17,9 +17,9 @@ import * as documentService from './services/document';
 // Context Access
 // =============================================================================
 
-function getContext(): EditorContext {
-    return getEditorContext();
-}
+// EditorContext is a process-wide singleton whose state is reset in place, so
+// every wrapper below shares the instance bound once at module load.
+const editorContext: EditorContext = getEditorContext();
 
 // =============================================================================
 // Core Functions
@@ -29,27 +29,24 @@ function getContext(): EditorContext {
  * Initialize workbook from markdown text and config.
  */
 export function initializeWorkbook(mdText: string, configJson: string): void {
-    const context = getContext();
-    context.initializeWorkbook(mdText, configJson);
+    editorContext.initializeWorkbook(mdText, configJson);
 }
 
 /**
  * Get the current state as JSON string.
  */
 export function getState(): string {
-    const context = getContext();
-    return context.getState();
+    return editorContext.getState();
 }
 
 /**
  * Create a new spreadsheet with initial columns.
  */
 export function createNewSpreadsheet(columnNames: string[] | null = null): UpdateResult {
-    const context = getContext();
-    if (!context.workbook) {
+    if (!editorContext.workbook) {
         initializeWorkbook('', '{}');
     }
-    return sheetService.addSheet(context, '', columnNames);
+    return sheetService.addSheet(editorContext, '', columnNames);
 }
 
 // =============================================================================
@@ -61,7 +58,7 @@ export function createNewSpreadsheet(columnNames: string[] | null = null): Updat
  * Pass null to delete tab_order (when metadata is not needed).
  */
 export function updateWorkbookTabOrder(tabOrder: TabOrderItem[] | null): UpdateResult {
-    return workbookService.updateWorkbookTabOrder(getContext(), tabOrder);
+    return workbookService.updateWorkbookTabOrder(editorContext, tabOrder);
 }
 
 // =============================================================================
@@ -78,35 +75,35 @@ export function addSheet(
     afterSheetIndex: number | null = null,
     targetTabOrderIndex: number | null = null
 ): UpdateResult {
-    return sheetService.addSheet(getContext(), newName, columnNames, tableName, afterSheetIndex, targetTabOrderIndex);
+    return sheetService.addSheet(editorContext, newName, columnNames, tableName, afterSheetIndex, targetTabOrderIndex);
 }
 
 /**
  * Rename a sheet.
  */
 export function renameSheet(sheetIdx: number, newName: string): UpdateResult {
-    return sheetService.renameSheet(getContext(), sheetIdx, newName);
+    return sheetService.renameSheet(editorContext, sheetIdx, newName);
 }
 
 /**
  * Delete a sheet.
  */
 export function deleteSheet(sheetIdx: number): UpdateResult {
-    return sheetService.deleteSheet(getContext(), sheetIdx);
+    return sheetService.deleteSheet(editorContext, sheetIdx);
 }
 
 /**
  * Move a sheet.
  */
 export function moveSheet(fromIndex: number, toIndex: number, targetTabOrderIndex: number | null = null): UpdateResult {
-    return sheetService.moveSheet(getContext(), fromIndex, toIndex, targetTabOrderIndex);
+    return sheetService.moveSheet(editorContext, fromIndex, toIndex, targetTabOrderIndex);
 }
 
 /**
  * Update sheet metadata.
  */
 export function updateSheetMetadata(sheetIdx: number, metadata: Record<string, unknown>): UpdateResult {
-    return sheetService.updateSheetMetadata(getContext(), sheetIdx, metadata);
+    return sheetService.updateSheetMetadata(editorContext, sheetIdx, metadata);
 }
 
 // =============================================================================
@@ -121,21 +118,21 @@ export function addTable(
     columnNames: string[] | null = null,
     tableName: string | null = null
 ): UpdateResult {
-    return tableService.addTable(getContext(), sheetIdx, columnNames, tableName);
+    return tableService.addTable(editorContext, sheetIdx, columnNames, tableName);
 }
 
 /**
  * Delete a table.
  */
 export function deleteTable(sheetIdx: number, tableIdx: number): UpdateResult {
-    return tableService.deleteTable(getContext(), sheetIdx, tableIdx);
+    return tableService.deleteTable(editorContext, sheetIdx, tableIdx);
 }
 
 /**
  * Rename a table.
  */
 export function renameTable(sheetIdx: number, tableIdx: number, newName: string): UpdateResult {
-    return tableService.renameTable(getContext(), sheetIdx, tableIdx, newName);
+    return tableService.renameTable(editorContext, sheetIdx, tableIdx, newName);
 }
 
 /**
@@ -147,7 +144,7 @@ export function updateTableMetadata(
     newName: string,
     newDescription: string
 ): UpdateResult {
-    return tableService.updateTableMetadata(getContext(), sheetIdx, tableIdx, newName, newDescription);
+    return tableService.updateTableMetadata(editorContext, sheetIdx, tableIdx, newName, newDescription);
 }
 
 /**
@@ -158,7 +155,7 @@ export function updateVisualMetadata(
     tableIdx: number,
     metadata: Record<string, unknown>
 ): UpdateResult {
-    return tableService.updateVisualMetadata(getContext(), sheetIdx, tableIdx, metadata);
+    return tableService.updateVisualMetadata(editorContext, sheetIdx, tableIdx, metadata);
 }
 
 // =============================================================================
@@ -175,7 +172,14 @@ export function updateCell(
     colIdx: number,
     value: string
 ): UpdateResult {
-    return tableService.updateCell(getContext(), sheetIdx, tableIdx, rowIdx, colIdx, value);
+    return tableService.updateCell(editorContext, sheetIdx, tableIdx, rowIdx, colIdx, value);
+}
+
+/**
+ * Update several cells of one table in a single edit.
+ */
+export function updateCells(sheetIdx: number, tableIdx: number, cells: CellUpdate[]): UpdateResult {
+    return tableService.updateCells(editorContext, sheetIdx, tableIdx, cells);
 }
 
 // =============================================================================
@@ -186,14 +190,14 @@ export function updateCell(
  * Insert a row.
  */
 export function insertRow(sheetIdx: number, tableIdx: number, rowIdx: number): UpdateResult {
-    return tableService.insertRow(getContext(), sheetIdx, tableIdx, rowIdx);
+    return tableService.insertRow(editorContext, sheetIdx, tableIdx, rowIdx);
 }
 
 /**
  * Delete rows.
  */
 export function deleteRows(sheetIdx: number, tableIdx: number, rowIndices: number[]): UpdateResult {
-    return tableService.deleteRows(getContext(), sheetIdx, tableIdx, rowIndices);
+    return tableService.deleteRows(editorContext, sheetIdx, tableIdx, rowIndices);
 }
 
 /**
@@ -207,14 +211,14 @@ export function deleteRow(sheetIdx: number, tableIdx: number, rowIdx: number): U
  * Move rows.
  */
 export function moveRows(sheetIdx: number, tableIdx: number, rowIndices: number[], targetIndex: number): UpdateResult {
-    return tableService.moveRows(getContext(), sheetIdx, tableIdx, rowIndices, targetIndex);
+    return tableService.moveRows(editorContext, sheetIdx, tableIdx, rowIndices, targetIndex);
 }
 
 /**
  * Sort rows by column.
  */
 export function sortRows(sheetIdx: number, tableIdx: number, colIdx: number, ascending: boolean): UpdateResult {
-    return tableService.sortRows(getContext(), sheetIdx, tableIdx, colIdx, ascending);
+    return tableService.sortRows(editorContext, sheetIdx, tableIdx, colIdx, ascending);
 }
 
 // =============================================================================
@@ -230,14 +234,14 @@ export function insertColumn(
     colIdx: number,
     columnName = 'New Column'
 ): UpdateResult {
-    return tableService.insertColumn(getContext(), sheetIdx, tableIdx, colIdx, columnName);
+    return tableService.insertColumn(editorContext, sheetIdx, tableIdx, colIdx, columnName);
 }
 
 /**
  * Delete columns.
  */
 export function deleteColumns(sheetIdx: number, tableIdx: number, colIndices: number[]): UpdateResult {
-    return tableService.deleteColumns(getContext(), sheetIdx, tableIdx, colIndices);
+    return tableService.deleteColumns(editorContext, sheetIdx, tableIdx, colIndices);
 }
 
 /**
@@ -256,14 +260,14 @@ export function moveColumns(
     colIndices: number[],
     targetIndex: number
 ): UpdateResult {
-    return tableService.moveColumns(getContext(), sheetIdx, tableIdx, colIndices, targetIndex);
+    return tableService.moveColumns(editorContext, sheetIdx, tableIdx, colIndices, targetIndex);
 }
 
 /**
  * Clear columns.
  */
 export function clearColumns(sheetIdx: number, tableIdx: number, colIndices: number[]): UpdateResult {
-    return tableService.clearColumns(getContext(), sheetIdx, tableIdx, colIndices);
+    return tableService.clearColumns(editorContext, sheetIdx, tableIdx, colIndices);
 }
 
 /**
@@ -277,14 +281,14 @@ export function clearColumn(sheetIdx: number, tableIdx: number, colIdx: number):
  * Update column width.
  */
 export function updateColumnWidth(sheetIdx: number, tableIdx: number, colIdx: number, width: number): UpdateResult {
-    return tableService.updateColumnWidth(getContext(), sheetIdx, tableIdx, colIdx, width);
+    return tableService.updateColumnWidth(editorContext, sheetIdx, tableIdx, colIdx, width);
 }
 
 /**
  * Update column format.
  */
 export function updateColumnFormat(sheetIdx: number, tableIdx: number, colIdx: number, fmt: unknown): UpdateResult {
-    return tableService.updateColumnFormat(getContext(), sheetIdx, tableIdx, colIdx, fmt);
+    return tableService.updateColumnFormat(editorContext, sheetIdx, tableIdx, colIdx, fmt);
 }
 
 /**
@@ -296,7 +300,7 @@ export function updateColumnAlign(
     colIdx: number,
     align: 'left' | 'center' | 'right'
 ): UpdateResult {
-    return tableService.updateColumnAlign(getContext(), sheetIdx, tableIdx, colIdx, align);
+    return tableService.updateColumnAlign(editorContext, sheetIdx, tableIdx, colIdx, align);
 }
 
 /**
@@ -308,7 +312,14 @@ export function updateColumnFilter(
     colIdx: number,
     hiddenValues: string[]
 ): UpdateResult {
-    return tableService.updateColumnFilter(getContext(), sheetIdx, tableIdx, colIdx, hiddenValues);
+    return tableService.updateColumnFilter(editorContext, sheetIdx, tableIdx, colIdx, hiddenValues);
+}
+
+/**
+ * Update width, format, filter and alignment of many columns in one table update.
+ */
+export function updateColumnsBulk(sheetIdx: number, tableIdx: number, updates: ColumnBulkUpdates): UpdateResult {
+    return tableService.updateColumnsBulk(editorContext, sheetIdx, tableIdx, updates);
 }
 
 // =============================================================================
@@ -326,7 +337,7 @@ export function pasteCells(
     newData: string[][],
     includeHeaders = false
 ): UpdateResult {
-    return tableService.pasteCells(getContext(), sheetIdx, tableIdx, startRow, startCol, newData, includeHeaders);
+    return tableService.pasteCells(editorContext, sheetIdx, tableIdx, startRow, startCol, newData, includeHeaders);
 }
 
 /**
@@ -339,7 +350,7 @@ export function moveCells(
     destRow: number,
     destCol: number
 ): UpdateResult {
-    return tableService.moveCells(getContext(), sheetIdx, tableIdx, srcRange, destRow, destCol);
+    return tableService.moveCells(editorContext, sheetIdx, tableIdx, srcRange, destRow, destCol);
 }
 
 // =============================================================================
@@ -352,7 +363,7 @@ export function moveCells(
 export function getDocumentSectionRange(
     sectionIndex: number
 ): { startLine: number; endLine: number } | { error: string } {
-    return documentService.getDocumentSectionRange(getContext(), sectionIndex);
+    return documentService.getDocumentSectionRange(editorContext, sectionIndex);
 }
 
 /**
@@ -364,7 +375,7 @@ export function addDocument(
     afterWorkbook = false,
     insertAfterTabOrderIndex = -1
 ): UpdateResult {
-    return documentService.addDocument(getContext(), title, afterDocIndex, afterWorkbook, insertAfterTabOrderIndex);
+    return documentService.addDocument(editorContext, title, afterDocIndex, afterWorkbook, insertAfterTabOrderIndex);
 }
 
 /**
@@ -377,7 +388,7 @@ export function addDocumentAndGetFullUpdate(
     insertAfterTabOrderIndex = -1
 ): UpdateResult {
     return documentService.addDocumentAndGetFullUpdate(
-        getContext(),
+        editorContext,
         title,
         afterDocIndex,
         afterWorkbook,
@@ -389,21 +400,21 @@ export function addDocumentAndGetFullUpdate(
  * Rename a document section.
  */
 export function renameDocument(docIndex: number, newTitle: string): UpdateResult {
-    return documentService.renameDocument(getContext(), docIndex, newTitle);
+    return documentService.renameDocument(editorContext, docIndex, newTitle);
 }
 
 /**
  * Delete a document section.
  */
 export function deleteDocument(docIndex: number): UpdateResult {
-    return documentService.deleteDocument(getContext(), docIndex);
+    return documentService.deleteDocument(editorContext, docIndex);
 }
 
 /**
  * Delete document and get full update.
  */
 export function deleteDocumentAndGetFullUpdate(docIndex: number): UpdateResult {
-    return documentService.deleteDocumentAndGetFullUpdate(getContext(), docIndex);
+    return documentService.deleteDocumentAndGetFullUpdate(editorContext, docIndex);
 }
 
 /**
@@ -417,7 +428,7 @@ export function moveDocumentSection(
     toBeforeWorkbook = false
 ): UpdateResult {
     return documentService.moveDocumentSection(
-        getContext(),
+        editorContext,
         fromDocIndex,
         toDocIndex,
         toAfterWorkbook,
@@ -434,7 +445,7 @@ export function moveWorkbookSection(
     toBeforeDoc = false,
     targetTabOrderIndex: number | null = null
 ): UpdateResult {
-    return documentService.moveWorkbookSection(getContext(), toDocIndex, toAfterDoc, toBeforeDoc, targetTabOrderIndex);
+    return documentService.moveWorkbookSection(editorContext, toDocIndex, toAfterDoc, toBeforeDoc, targetTabOrderIndex);
 }
 
 // =============================================================================
@@ -445,18 +456,17 @@ export function moveWorkbookSection(
  * Get the full markdown content.
  */
 export function getFullMarkdown(): string {
-    const context = getContext();
-    if (!context.workbook || !context.schema) {
-        return context.mdText;
+    if (!editorContext.workbook || !editorContext.schema) {
+        return editorContext.mdText;
     }
-    return context.workbook.toMarkdown(context.schema);
+    return workbookService.workbookToMarkdown(editorContext.workbook, editorContext.schema);
 }
 
 /**
  * Generate and get range for workbook section.
  */
 export function generateAndGetRange(): UpdateResult {
-    return workbookService.generateAndGetRange(getContext());
+    return workbookService.generateAndGetRange(editorContext);
 }
 
 /**
@@ -474,5 +484,5 @@ export function getWorkbookRange(mdText: string, rootMarker: string, sheetHeader
  * Reset the editor context (for testing purposes).
  */
 export function resetContext(): void {
-    getContext().reset();
+    editorContext.reset();
 }
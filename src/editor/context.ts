@@ -4,8 +4,9 @@
  */
 
 import { parseWorkbook, Workbook, MultiTableParsingSchema } from 'md-spreadsheet-parser';
-import type { EditorConfig, StructureSection } from './types';
+import type { EditorConfig } from './types';
 import { extractStructure, augmentWorkbookMetadata } from './utils/structure';
+import { parseEditorConfig } from './utils/config';
 import { initializeTabOrderFromStructure } from './services/workbook';
 
 // =============================================================================
@@ -35,6 +36,14 @@ function createEditorState(): EditorState {
 export class EditorContext {
     private static instance: EditorContext | null = null;
     private state: EditorState = createEditorState();
+    // Last serialized state. The output depends only on these inputs, and the
+    // workbook is replaced (never mutated) on every edit, so identity is enough.
+    private stateCache: {
+        workbook: Workbook;
+        schema: MultiTableParsingSchema | null;
+        mdText: string;
+        json: string;
+    } | null = null;
 
     private constructor() {}
 
@@ -105,10 +114,20 @@ export class EditorContext {
             return JSON.stringify({ workbook: null, structure: null });
         }
 
+        const cache = this.stateCache;
+        if (
+            cache &&
+            cache.workbook === this.state.workbook &&
+            cache.schema === this.state.schema &&
+            cache.mdText === this.state.mdText
+        ) {
+            return cache.json;
+        }
+
         // Use .json getter (not toDTO()) to get metadata as plain objects
         // This matches Python's .json property behavior
         let workbookJson = this.state.workbook.json;
-        let structure: StructureSection[] | null = null;
+        let structureJson = 'null';
 
         if (this.state.schema) {
             const rootMarker = this.state.schema.rootMarker ?? '# Tables';
@@ -118,14 +137,19 @@ export class EditorContext {
             workbookJson = augmentWorkbookMetadata(workbookJson, this.state.mdText, rootMarker, sheetHeaderLevel);
 
             // Extract structure
-            const structureJson = extractStructure(this.state.mdText, rootMarker);
-            structure = JSON.parse(structureJson);
+            structureJson = extractStructure(this.state.mdText, rootMarker);
         }
 
-        return JSON.stringify({
-            workbook: workbookJson,
-            structure: structure
-        });
+        // The structure is already serialized (and cached), so splice it in
+        // rather than parsing it only to encode it again
+        const json = `{"workbook":${JSON.stringify(workbookJson)},"structure":${structureJson}}`;
+        this.stateCache = {
+            workbook: this.state.workbook,
+            schema: this.state.schema,
+            mdText: this.state.mdText,
+            json
+        };
+        return json;
     }
 
     updateWorkbook(newWorkbook: Workbook): void {
@@ -134,6 +158,7 @@ export class EditorContext {
 
     reset(): void {
         this.state = createEditorState();
+        this.stateCache = null;
     }
 
     getState(): string {
@@ -144,7 +169,7 @@ export class EditorContext {
         this.state.mdText = mdText;
         this.state.config = configJson;
 
-        const configDict: EditorConfig = configJson ? JSON.parse(configJson) : {};
+        const configDict: EditorConfig = parseEditorConfig(configJson);
 
         this.state.schema = new MultiTableParsingSchema({
             rootMarker: configDict.rootMarker ?? '# Tables',
@@ -12,6 +12,8 @@ export type {
     UpdateResult,
     TabOrderItem,
     CellRange,
+    CellUpdate,
+    ColumnBulkUpdates,
     EditorConfig,
     StructureSection,
     DocumentSection,
@@ -7,7 +7,14 @@
 import { Workbook } from 'md-spreadsheet-parser';
 import type { EditorContext } from '../context';
 import type { UpdateResult, EditorConfig, TabOrderItem } from '../types';
-import { generateAndGetRange, getWorkbookRange, initializeTabOrderFromStructure } from './workbook';
+import {
+    generateAndGetRange,
+    getWorkbookRange,
+    initializeTabOrderFromStructure,
+    removeTabOrderEntry
+} from './workbook';
+import { splitLines, scanTopLevelHeaders } from '../utils/lines';
+import { parseEditorConfig } from '../utils/config';
 
 // =============================================================================
 // Document Section Range
@@ -21,39 +28,29 @@ export function getDocumentSectionRange(
     sectionIndex: number
 ): { startLine: number; endLine: number } | { error: string } {
     const mdText = context.mdText;
-    const configDict: EditorConfig = context.config ? JSON.parse(context.config) : {};
+    const configDict: EditorConfig = parseEditorConfig(context.config);
     const rootMarker = configDict.rootMarker ?? '# Tables';
 
-    const lines = mdText.split('\n');
+    const lines = splitLines(mdText);
     let docIdx = 0;
     let currentDocStart: number | null = null;
-    let inCodeBlock = false;
 
-    for (let i = 0; i < lines.length; i++) {
-        const line = lines[i];
-        if (line.trim().startsWith('```')) {
-            inCodeBlock = !inCodeBlock;
+    for (const header of scanTopLevelHeaders(lines, rootMarker)) {
+        // If we were tracking a document and hit ANY level-1 header, end it here
+        if (currentDocStart !== null) {
+            return { startLine: currentDocStart, endLine: header.line };
         }
 
-        if (!inCodeBlock && line.startsWith('# ') && !line.startsWith('## ')) {
-            const stripped = line.trim();
-
-            // If we were tracking a document and hit ANY level-1 header, end it here
-            if (currentDocStart !== null) {
-                return { startLine: currentDocStart, endLine: i };
-            }
-
-            if (stripped === rootMarker) {
-                // Workbook section - not a document, skip
-                continue;
-            }
+        if (header.isWorkbook) {
+            // Workbook section - not a document, skip
+            continue;
+        }
 
-            // Found a document section
-            if (docIdx === sectionIndex) {
-                currentDocStart = i;
-            }
-            docIdx++;
+        // Found a document section
+        if (docIdx === sectionIndex) {
+            currentDocStart = header.line;
         }
+        docIdx++;
     }
 
     if (currentDocStart !== null) {
@@ -78,57 +75,37 @@ export function addDocument(
     insertAfterTabOrderIndex = -1
 ): UpdateResult {
     const mdText = context.mdText;
-    const configDict: EditorConfig = context.config ? JSON.parse(context.config) : {};
+    const configDict: EditorConfig = parseEditorConfig(context.config);
     const rootMarker = configDict.rootMarker ?? '# Tables';
 
-    const lines = mdText.split('\n');
+    const lines = splitLines(mdText);
     // Python uses insertLine = 0 by default (insert at beginning)
     // Only set to len(lines) if afterDocIndex >= 0 and doc not found
     let insertLine = afterDocIndex >= 0 || afterWorkbook ? lines.length : 0;
     let docCount = 0;
 
-    let inCodeBlock = false;
-
     // Parse the structure to find insertion point
-    for (let i = 0; i < lines.length; i++) {
-        const line = lines[i];
-        if (line.trim().startsWith('```')) {
-            inCodeBlock = !inCodeBlock;
-        }
-
-        if (!inCodeBlock && line.startsWith('# ') && !line.startsWith('## ')) {
-            const stripped = line.trim();
-            if (stripped === rootMarker) {
-                if (afterWorkbook && afterDocIndex < 0) {
-                    // Insert right after workbook (before any docs after WB)
-                    // Used for between-sheets insertion per SPECS.md 8.5
-                    const [, wbEnd] = getWorkbookRange(mdText, rootMarker, configDict.sheetHeaderLevel ?? 2);
-                    insertLine = wbEnd;
-                    break;
-                }
-                // Either not afterWorkbook, or we have a specific afterDocIndex to find
-                continue;
-            }
-
-            // Document found
-            if (afterDocIndex >= 0 && docCount === afterDocIndex) {
-                // Find end of this document
-                let nextI = i + 1;
-                while (nextI < lines.length) {
-                    const nextLine = lines[nextI];
-                    if (nextLine.trim().startsWith('```')) {
-                        inCodeBlock = !inCodeBlock;
-                    }
-                    if (!inCodeBlock && nextLine.startsWith('# ') && !nextLine.startsWith('## ')) {
-                        break;
-                    }
-                    nextI++;
-                }
-                insertLine = nextI;
+    const headers = scanTopLevelHeaders(lines, rootMarker);
+    for (let h = 0; h < headers.length; h++) {
+        if (headers[h].isWorkbook) {
+            if (afterWorkbook && afterDocIndex < 0) {
+                // Insert right after workbook (before any docs after WB)
+                // Used for between-sheets insertion per SPECS.md 8.5
+                const [, wbEnd] = getWorkbookRange(mdText, rootMarker, configDict.sheetHeaderLevel ?? 2);
+                insertLine = wbEnd;
                 break;
             }
-            docCount++;
+            // Either not afterWorkbook, or we have a specific afterDocIndex to find
+            continue;
+        }
+
+        // Document found
+        if (afterDocIndex >= 0 && docCount === afterDocIndex) {
+            // This document ends at the next level-1 header (or end of file)
+            insertLine = h + 1 < headers.length ? headers[h + 1].line : lines.length;
+            break;
         }
+        docCount++;
     }
 
     // Create the new document content
@@ -175,9 +152,11 @@ export function addDocument(
         }
 
         // Shift document indices >= newDocIndex
-        for (const item of tabOrder) {
+        for (let pos = 0; pos < tabOrder.length; pos++) {
+            const item = tabOrder[pos];
             if (item.type === 'document' && item.index >= newDocIndex) {
-                item.index++;
+                // Copy on write: items are shared with the previous workbook's metadata
+                tabOrder[pos] = { ...item, index: item.index + 1 };
             }
         }
 
@@ -216,7 +195,7 @@ export function renameDocument(context: EditorContext, docIndex: number, newTitl
     }
 
     const { startLine } = rangeResult;
-    const lines = context.mdText.split('\n');
+    const lines = [...splitLines(context.mdText)];
 
     // Replace the header line
     lines[startLine] = `# ${newTitle}`;
@@ -245,7 +224,7 @@ export function deleteDocument(context: EditorContext, docIndex: number): Update
     }
 
     const { startLine, endLine } = rangeResult;
-    const lines = context.mdText.split('\n');
+    const lines = [...splitLines(context.mdText)];
 
     // Remove the document section
     lines.splice(startLine, endLine - startLine);
@@ -256,18 +235,8 @@ export function deleteDocument(context: EditorContext, docIndex: number): Update
     const workbook = context.workbook;
     if (workbook) {
         const metadata = { ...(workbook.metadata || {}) };
-        let tabOrder: TabOrderItem[] = [...(metadata.tab_order || [])];
-
         // Remove deleted document and shift indices
-        tabOrder = tabOrder.filter((item) => !(item.type === 'document' && item.index === docIndex));
-
-        for (const item of tabOrder) {
-            if (item.type === 'document' && item.index > docIndex) {
-                item.index--;
-            }
-        }
-
-        metadata.tab_order = tabOrder;
+        metadata.tab_order = removeTabOrderEntry(metadata.tab_order || [], 'document', docIndex);
         const newWorkbook = new Workbook({ ...workbook, metadata });
         context.updateWorkbook(newWorkbook);
     }
@@ -281,30 +250,12 @@ export function deleteDocument(context: EditorContext, docIndex: number): Update
 }
 
 /**
- * Delete document and return full update.
- * Matches Python's delete_document_and_get_full_update behavior:
- * 1. Delete document from md_text
- * 2. Regenerate workbook content
- * 3. Embed regenerated workbook back into md_text
- * 4. Return full md_text with workbook and structure
+ * Regenerate workbook content, embed it into md_text and return the full update.
+ * Shared postlude of the *AndGetFullUpdate document operations.
  */
-export function deleteDocumentAndGetFullUpdate(context: EditorContext, docIndex: number): UpdateResult {
-    // 1. Get original line count
-    const originalMd = context.mdText;
-    const originalLineCount = originalMd.split('\n').length;
-
-    // 2. Delete the document (updates md_text in context)
-    const deleteResult = deleteDocument(context, docIndex);
-    if (deleteResult.error) {
-        return deleteResult;
-    }
-
-    // 3. Regenerate workbook content
+function embedWorkbookAndGetFullUpdate(context: EditorContext, originalLineCount: number): UpdateResult {
     const wbUpdate = generateAndGetRange(context);
-
-    // 4. Embed the regenerated workbook content into the md_text
     let currentMd = context.mdText;
-    let currentLines = currentMd.split('\n');
 
     if (wbUpdate && !wbUpdate.error && wbUpdate.content !== undefined) {
         const wbStart = wbUpdate.startLine!;
@@ -315,14 +266,12 @@ export function deleteDocumentAndGetFullUpdate(context: EditorContext, docIndex:
             wbContentLines.push('');
         }
 
-        currentLines = [...currentLines.slice(0, wbStart), ...wbContentLines, ...currentLines.slice(wbEnd + 1)];
-        currentMd = currentLines.join('\n');
+        const lines = splitLines(currentMd);
+        currentMd = [...lines.slice(0, wbStart), ...wbContentLines, ...lines.slice(wbEnd + 1)].join('\n');
         context.mdText = currentMd;
     }
 
-    // 5. Get full state
-    const fullStateJson = context.getFullStateDict();
-    const fullState = JSON.parse(fullStateJson);
+    const fullState = JSON.parse(context.getFullStateDict());
 
     return {
         content: currentMd,
@@ -335,6 +284,29 @@ export function deleteDocumentAndGetFullUpdate(context: EditorContext, docIndex:
     };
 }
 
+/**
+ * Delete document and return full update.
+ * Matches Python's delete_document_and_get_full_update behavior:
+ * 1. Delete document from md_text
+ * 2. Regenerate workbook content
+ * 3. Embed regenerated workbook back into md_text
+ * 4. Return full md_text with workbook and structure
+ */
+export function deleteDocumentAndGetFullUpdate(context: EditorContext, docIndex: number): UpdateResult {
+    // 1. Get original line count
+    const originalMd = context.mdText;
+    const originalLineCount = splitLines(originalMd).length;
+
+    // 2. Delete the document (updates md_text in context)
+    const deleteResult = deleteDocument(context, docIndex);
+    if (deleteResult.error) {
+        return deleteResult;
+    }
+
+    // 3. Regenerate the workbook and embed it back into md_text
+    return embedWorkbookAndGetFullUpdate(context, originalLineCount);
+}
+
 /**
  * Add document and return full update.
  * Matches Python's add_document_and_get_full_update behavior:
@@ -356,42 +328,9 @@ export function addDocumentAndGetFullUpdate(
         return addResult;
     }
 
-    // 2. Get current md_text from context
-    let currentMd = context.mdText;
-    let lines = currentMd.split('\n');
-    const originalLineCount = lines.length;
-
-    // 3. Regenerate workbook content
-    const wbUpdate = generateAndGetRange(context);
-
-    // 4. Embed the regenerated workbook content into the md_text
-    if (wbUpdate && !wbUpdate.error && wbUpdate.content !== undefined) {
-        const wbStart = wbUpdate.startLine!;
-        const wbEnd = wbUpdate.endLine!;
-        const wbContent = wbUpdate.content;
-        const wbContentLines = wbContent.trimEnd().split('\n');
-        if (wbContent) {
-            wbContentLines.push('');
-        }
-
-        lines = [...lines.slice(0, wbStart), ...wbContentLines, ...lines.slice(wbEnd + 1)];
-        currentMd = lines.join('\n');
-        context.mdText = currentMd;
-    }
-
-    // 5. Get full state
-    const fullStateJson = context.getFullStateDict();
-    const fullState = JSON.parse(fullStateJson);
-
-    return {
-        content: currentMd,
-        startLine: 0,
-        endLine: originalLineCount - 1,
-        endCol: 0,
-        workbook: fullState.workbook,
-        structure: fullState.structure,
-        file_changed: true
-    };
+    // 2. Regenerate the workbook and embed it back into md_text
+    const originalLineCount = splitLines(context.mdText).length;
+    return embedWorkbookAndGetFullUpdate(context, originalLineCount);
 }
 
 // =============================================================================
@@ -417,16 +356,15 @@ export function moveDocumentSection(
     }
 
     const { startLine, endLine } = rangeResult;
-    const lines = context.mdText.split('\n');
+    const lines = splitLines(context.mdText);
 
     // Extract the document content
     const docContent = lines.slice(startLine, endLine);
 
-    // Remove from original position
-    const linesWithoutDoc = [...lines];
-    linesWithoutDoc.splice(startLine, endLine - startLine);
+    // Remove from original position, building the remaining lines in one pass
+    const linesWithoutDoc = lines.slice(0, startLine).concat(lines.slice(endLine));
 
-    const configDict: EditorConfig = context.config ? JSON.parse(context.config) : {};
+    const configDict: EditorConfig = parseEditorConfig(context.config);
     const rootMarker = configDict.rootMarker ?? '# Tables';
     const sheetHeaderLevel = configDict.sheetHeaderLevel ?? 2;
 
@@ -448,25 +386,20 @@ export function moveDocumentSection(
             // Find the target doc position
             let docIdx = 0;
             let foundTarget = false;
-            let inCodeBlock = false;
             const tempText = linesWithoutDoc.join('\n');
             const [wbStart] = getWorkbookRange(tempText, rootMarker, sheetHeaderLevel);
 
-            for (let i = 0; i < wbStart; i++) {
-                const line = linesWithoutDoc[i];
-                if (line.trim().startsWith('```')) {
-                    inCodeBlock = !inCodeBlock;
+            for (const header of scanTopLevelHeaders(linesWithoutDoc, rootMarker)) {
+                if (header.line >= wbStart) {
+                    break;
                 }
-                if (!inCodeBlock && line.startsWith('# ') && !line.startsWith('## ')) {
-                    const stripped = line.trim();
-                    if (stripped !== rootMarker) {
-                        if (docIdx === toDocIndex) {
-                            insertLine = i;
-                            foundTarget = true;
-                            break;
-                        }
-                        docIdx++;
+                if (!header.isWorkbook) {
+                    if (docIdx === toDocIndex) {
+                        insertLine = header.line;
+                        foundTarget = true;
+                        break;
                     }
+                    docIdx++;
                 }
             }
             if (!foundTarget) {
@@ -485,26 +418,17 @@ export function moveDocumentSection(
         // Find the target document position
         let docIdx = 0;
         let targetLine = linesWithoutDoc.length;
-        let inCodeBlock = false;
         let foundTarget = false;
 
-        for (let i = 0; i < linesWithoutDoc.length; i++) {
-            const line = linesWithoutDoc[i];
-            if (line.trim().startsWith('```')) {
-                inCodeBlock = !inCodeBlock;
-            }
-
-            if (!inCodeBlock && line.startsWith('# ') && !line.startsWith('## ')) {
-                const stripped = line.trim();
-                if (stripped !== rootMarker) {
-                    if (docIdx === adjustedToDocIndex) {
-                        // Insert BEFORE this document (at its start line)
-                        targetLine = i;
-                        foundTarget = true;
-                        break;
-                    }
-                    docIdx++;
+        for (const header of scanTopLevelHeaders(linesWithoutDoc, rootMarker)) {
+            if (!header.isWorkbook) {
+                if (docIdx === adjustedToDocIndex) {
+                    // Insert BEFORE this document (at its start line)
+                    targetLine = header.line;
+                    foundTarget = true;
+                    break;
                 }
+                docIdx++;
             }
         }
 
@@ -551,9 +475,22 @@ export function moveDocumentSection(
         insertLine = linesWithoutDoc.length;
     }
 
-    // Insert at new position
-    linesWithoutDoc.splice(insertLine, 0, ...docContent);
-    const newMdText = linesWithoutDoc.join('\n');
+    // Dropped back where it came from: the text is unchanged, but still return
+    // it so the caller can merge in a tab_order that was updated beforehand
+    if (insertLine === startLine) {
+        return {
+            content: context.mdText,
+            startLine: 0,
+            endLine: lines.length,
+            file_changed: true
+        };
+    }
+
+    // Insert at new position. concat avoids spreading a long section into splice's arguments
+    const newMdText = linesWithoutDoc
+        .slice(0, insertLine)
+        .concat(docContent, linesWithoutDoc.slice(insertLine))
+        .join('\n');
     context.mdText = newMdText;
 
     return {
@@ -579,12 +516,12 @@ export function moveWorkbookSection(
     toBeforeDoc = false,
     targetTabOrderIndex: number | null = null
 ): UpdateResult {
-    const configDict: EditorConfig = context.config ? JSON.parse(context.config) : {};
+    const configDict: EditorConfig = parseEditorConfig(context.config);
     const rootMarker = configDict.rootMarker ?? '# Tables';
     const sheetHeaderLevel = configDict.sheetHeaderLevel ?? 2;
 
     const mdText = context.mdText;
-    const lines = mdText.split('\n');
+    const lines = splitLines(mdText);
 
     // Find workbook range
     const [wbStart, wbEnd] = getWorkbookRange(mdText, rootMarker, sheetHeaderLevel);
@@ -596,35 +533,26 @@ export function moveWorkbookSection(
     // Extract workbook content
     const wbContent = lines.slice(wbStart, wbEnd);
 
-    // Remove workbook from original position
-    const linesWithoutWb = [...lines];
-    linesWithoutWb.splice(wbStart, wbEnd - wbStart);
+    // Remove workbook from original position, building the remaining lines in one pass
+    const linesWithoutWb = lines.slice(0, wbStart).concat(lines.slice(wbEnd));
 
     // Calculate new insertion point
     let insertLine: number;
 
     if (toDocIndex !== null) {
         // Find the target document position
+        const headers = scanTopLevelHeaders(linesWithoutWb, rootMarker);
         let docIdx = 0;
         let targetLine = 0;
-        let inCodeBlock = false;
 
-        for (let i = 0; i < linesWithoutWb.length; i++) {
-            const line = linesWithoutWb[i];
-            if (line.trim().startsWith('```')) {
-                inCodeBlock = !inCodeBlock;
-            }
-
-            if (!inCodeBlock && line.startsWith('# ') && !line.startsWith('## ')) {
-                const stripped = line.trim();
-                if (stripped !== rootMarker) {
-                    if (docIdx === toDocIndex && toBeforeDoc) {
-                        // For toBeforeDoc, insert before this document
-                        targetLine = i;
-                        break;
-                    }
-                    docIdx++;
+        for (const header of headers) {
+            if (!header.isWorkbook) {
+                if (docIdx === toDocIndex && toBeforeDoc) {
+                    // For toBeforeDoc, insert before this document
+                    targetLine = header.line;
+                    break;
                 }
+                docIdx++;
             }
         }
 
@@ -632,29 +560,19 @@ export function moveWorkbookSection(
             // Find end of target document
             let foundDoc = false;
             docIdx = 0;
-            inCodeBlock = false;
 
-            for (let i = 0; i < linesWithoutWb.length; i++) {
-                const line = linesWithoutWb[i];
-                if (line.trim().startsWith('```')) {
-                    inCodeBlock = !inCodeBlock;
+            for (const header of headers) {
+                // If we found the target doc and hit ANY level-1 header, end here
+                if (foundDoc) {
+                    targetLine = header.line;
+                    break;
                 }
 
-                if (!inCodeBlock && line.startsWith('# ') && !line.startsWith('## ')) {
-                    const stripped = line.trim();
-
-                    // If we found the target doc and hit ANY level-1 header, end here
-                    if (foundDoc) {
-                        targetLine = i;
-                        break;
-                    }
-
-                    if (stripped !== rootMarker) {
-                        if (docIdx === toDocIndex) {
-                            foundDoc = true;
-                        }
-                        docIdx++;
+                if (!header.isWorkbook) {
+                    if (docIdx === toDocIndex) {
+                        foundDoc = true;
                     }
+                    docIdx++;
                 }
             }
 
@@ -668,10 +586,12 @@ export function moveWorkbookSection(
         insertLine = linesWithoutWb.length;
     }
 
-    // Insert at new position
-    linesWithoutWb.splice(insertLine, 0, ...wbContent);
-    const newMdText = linesWithoutWb.join('\n');
-    context.mdText = newMdText;
+    // Insert at new position, reusing the text when dropped back where it came from
+    let newMdText = mdText;
+    if (insertLine !== wbStart) {
+        newMdText = linesWithoutWb.slice(0, insertLine).concat(wbContent, linesWithoutWb.slice(insertLine)).join('\n');
+        context.mdText = newMdText;
+    }
 
     // Update workbook reference
     // IMPORTANT: Preserve existing tab_order if it was pre-set by updateWorkbookTabOrder
@@ -10,6 +10,7 @@ import {
     applySheetUpdate,
     generateAndGetRange,
     initializeTabOrderFromStructure,
+    removeTabOrderEntry,
     reorderTabMetadata,
     updateWorkbook
 } from './workbook';
@@ -158,6 +159,10 @@ export function updateSheetMetadata(
     metadata: Record<string, unknown>
 ): UpdateResult {
     return applySheetUpdate(context, sheetIdx, (sheet) => {
+        // The webview sends a fresh object each time, so compare by content
+        if (sheet.metadata === metadata || JSON.stringify(sheet.metadata) === JSON.stringify(metadata)) {
+            return sheet;
+        }
         return new Sheet({
             ...sheet,
             metadata
@@ -176,19 +181,8 @@ export function deleteSheet(context: EditorContext, sheetIdx: number): UpdateRes
         // 2. Update tab_order metadata
         const metadata = { ...(newWb.metadata || {}) };
         if (metadata.tab_order && Array.isArray(metadata.tab_order)) {
-            let tabOrder: TabOrderItem[] = [...metadata.tab_order];
-
-            // Remove deleted sheet entry
-            tabOrder = tabOrder.filter((item) => !(item.type === 'sheet' && item.index === sheetIdx));
-
-            // Shift remaining sheet indices
-            for (const item of tabOrder) {
-                if (item.type === 'sheet' && item.index > sheetIdx) {
-                    item.index--;
-                }
-            }
-
-            metadata.tab_order = tabOrder;
+            // Remove deleted sheet entry and shift remaining sheet indices
+            metadata.tab_order = removeTabOrderEntry(metadata.tab_order, 'sheet', sheetIdx);
             return new Workbook({ ...newWb, metadata });
         }
 
@@ -206,25 +200,36 @@ export function moveSheet(
     targetTabOrderIndex: number | null = null
 ): UpdateResult {
     const wbTransform = (wb: Workbook): Workbook => {
-        const newSheets = [...(wb.sheets ?? [])];
-        if (fromIndex < 0 || fromIndex >= newSheets.length) {
+        const sheets = wb.sheets ?? [];
+        if (fromIndex < 0 || fromIndex >= sheets.length) {
             throw new Error('Invalid source index');
         }
 
-        const sheet = newSheets.splice(fromIndex, 1)[0];
-
-        // Clamp toIndex to valid insertion points
-        const insertIdx = Math.max(0, Math.min(toIndex, newSheets.length));
-        newSheets.splice(insertIdx, 0, sheet);
+        // Clamp toIndex to valid insertion points (the list is one shorter once the sheet is removed)
+        const insertIdx = Math.max(0, Math.min(toIndex, sheets.length - 1));
 
-        let updatedWb = new Workbook({
-            ...wb,
-            sheets: newSheets
-        });
+        let updatedWb = wb;
+        if (insertIdx !== fromIndex) {
+            // Shift the sheets in between by one slot and drop the moved sheet into the gap
+            const newSheets = [...sheets];
+            if (fromIndex < insertIdx) {
+                newSheets.copyWithin(fromIndex, fromIndex + 1, insertIdx + 1);
+            } else {
+                newSheets.copyWithin(insertIdx + 1, insertIdx, fromIndex);
+            }
+            newSheets[insertIdx] = sheets[fromIndex];
+            updatedWb = new Workbook({
+                ...wb,
+                sheets: newSheets
+            });
+        }
 
         if (targetTabOrderIndex !== null) {
             // Metadata is required - update tab_order
             updatedWb = reorderTabMetadata(updatedWb, 'sheet', fromIndex, insertIdx, targetTabOrderIndex)!;
+        } else if (updatedWb === wb && !(wb.metadata && 'tab_order' in wb.metadata)) {
+            // Dropped back in place with no tab_order to clear: nothing changed
+            return wb;
         } else {
             // Metadata is NOT required - delete tab_order to prevent unwanted metadata in output
             // This is critical for SPECS.md 8.6 S1/S2 sheet swap cases
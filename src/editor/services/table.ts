@@ -5,8 +5,8 @@
 
 import { Table, Sheet } from 'md-spreadsheet-parser';
 import type { EditorContext } from '../context';
-import type { UpdateResult, CellRange, ColumnMetadata } from '../types';
-import { applySheetUpdate } from './workbook';
+import type { UpdateResult, CellRange, CellUpdate, ColumnMetadata, ColumnBulkUpdates } from '../types';
+import { applySheetUpdate, applyTableUpdate } from './workbook';
 
 // =============================================================================
 // Table CRUD Operations
@@ -116,6 +116,9 @@ export function renameTable(context: EditorContext, sheetIdx: number, tableIdx:
             throw new Error('Invalid table index');
         }
         const table = tables[tableIdx];
+        if (table.name === newName) {
+            return sheet;
+        }
         const renamedTable = table.rename(newName);
         return sheet.replaceTable(tableIdx, renamedTable);
     });
@@ -131,18 +134,15 @@ export function updateTableMetadata(
     newName: string,
     newDescription: string
 ): UpdateResult {
-    return applySheetUpdate(context, sheetIdx, (sheet) => {
-        const newTables = [...(sheet.tables ?? [])];
-        if (tableIdx < 0 || tableIdx >= newTables.length) {
-            throw new Error('Invalid table index');
+    return applyTableUpdate(context, sheetIdx, tableIdx, (targetTable) => {
+        if (targetTable.name === newName && targetTable.description === newDescription) {
+            return targetTable;
         }
-        const targetTable = newTables[tableIdx];
-        newTables[tableIdx] = new Table({
+        return new Table({
             ...targetTable,
             name: newName,
             description: newDescription
         });
-        return new Sheet({ ...sheet, tables: newTables });
     });
 }
 
@@ -155,15 +155,9 @@ export function updateVisualMetadata(
     tableIdx: number,
     visualMetadata: Record<string, unknown>
 ): UpdateResult {
-    return applySheetUpdate(context, sheetIdx, (sheet) => {
-        const newTables = [...(sheet.tables ?? [])];
-        if (tableIdx < 0 || tableIdx >= newTables.length) {
-            throw new Error('Invalid table index');
-        }
-        const targetTable = newTables[tableIdx];
+    return applyTableUpdate(context, sheetIdx, tableIdx, (targetTable) => {
         const metadata = { ...(targetTable.metadata || {}), visual: visualMetadata };
-        newTables[tableIdx] = new Table({ ...targetTable, metadata });
-        return new Sheet({ ...sheet, tables: newTables });
+        return new Table({ ...targetTable, metadata });
     });
 }
 
@@ -171,6 +165,11 @@ export function updateVisualMetadata(
 // Cell Operations
 // =============================================================================
 
+const PIPE_PATTERN = /\|/g;
+// Tokens the escaper cares about: a code span (closed by the next unescaped
+// backtick or running to the end), an escaped character, or a bare pipe.
+const ESCAPE_TOKEN_PATTERN = /`(?:[^`\\]|\\[\s\S]?)*(?:`|$)|\\[\s\S]|\|/g;
+
 /**
  * Escape pipe characters for GFM table cells.
  */
@@ -179,33 +178,72 @@ function escapePipe(value: string): string {
         return value;
     }
 
-    const result: string[] = [];
-    let inCode = false;
-    let i = 0;
-
-    while (i < value.length) {
-        const char = value[i];
-
-        if (char === '`') {
-            inCode = !inCode;
-            result.push(char);
-            i++;
-        } else if (char === '\\' && i + 1 < value.length) {
-            // Already escaped, keep as is
-            result.push(char);
-            result.push(value[i + 1]);
-            i += 2;
-        } else if (char === '|' && !inCode) {
-            // Escape the pipe
-            result.push('\\|');
-            i++;
-        } else {
-            result.push(char);
-            i++;
+    // Without code spans or existing escapes every pipe gets escaped, so a
+    // single native replace is equivalent to the token pass below.
+    if (!value.includes('`') && !value.includes('\\')) {
+        return value.replace(PIPE_PATTERN, '\\|');
+    }
+
+    // Code spans and escaped characters are copied through untouched; only
+    // bare pipes outside code are rewritten.
+    return value.replace(ESCAPE_TOKEN_PATTERN, (token) => (token === '|' ? '\\|' : token));
+}
+
+/**
+ * Pad a row in place with empty cells up to the given length.
+ */
+function padRow(row: string[], length: number): string[] {
+    const start = row.length;
+    if (start < length) {
+        row.length = length;
+        row.fill('', start);
+    }
+    return row;
+}
+
+/**
+ * A fresh row of `width` empty cells.
+ */
+function emptyRow(width: number): string[] {
+    return new Array(width).fill('');
+}
+
+/**
+ * Copy-on-write view over table rows. Rows are shared with the source table
+ * until first written through edit(), so an edit only copies the rows it touches.
+ */
+class CopyOnWriteRows {
+    private readonly rows: string[][];
+    private readonly owned = new Set<number>();
+
+    constructor(source: string[][]) {
+        this.rows = [...source];
+    }
+
+    get length(): number {
+        return this.rows.length;
+    }
+
+    get(rowIdx: number): string[] {
+        return this.rows[rowIdx];
+    }
+
+    edit(rowIdx: number): string[] {
+        if (!this.owned.has(rowIdx)) {
+            this.rows[rowIdx] = [...this.rows[rowIdx]];
+            this.owned.add(rowIdx);
         }
+        return this.rows[rowIdx];
+    }
+
+    push(row: string[]): void {
+        this.owned.add(this.rows.length);
+        this.rows.push(row);
     }
 
-    return result.join('');
+    toArray(): string[][] {
+        return this.rows;
+    }
 }
 
 /**
@@ -221,13 +259,7 @@ export function updateCell(
 ): UpdateResult {
     const escapedValue = escapePipe(value);
 
-    return applySheetUpdate(context, sheetIdx, (sheet) => {
-        const newTables = [...(sheet.tables ?? [])];
-        if (tableIdx < 0 || tableIdx >= newTables.length) {
-            throw new Error('Invalid table index');
-        }
-        const targetTable = newTables[tableIdx];
-
+    return applyTableUpdate(context, sheetIdx, tableIdx, (targetTable) => {
         // Handle header row edit (rowIdx = -1)
         if (rowIdx === -1) {
             const newHeaders = [...targetTable.headers];
@@ -235,29 +267,83 @@ export function updateCell(
                 throw new Error('Invalid column index');
             }
             newHeaders[colIdx] = escapedValue;
-            newTables[tableIdx] = new Table({ ...targetTable, headers: newHeaders });
-            return new Sheet({ ...sheet, tables: newTables });
+            return new Table({ ...targetTable, headers: newHeaders });
+        }
+
+        // Re-entering the current value leaves the table (and sheet) untouched
+        const currentRow = targetTable.rows[rowIdx];
+        if (currentRow && colIdx < currentRow.length && currentRow[colIdx] === escapedValue) {
+            return targetTable;
         }
 
         // Ensure rows array has enough rows
         const newRows = [...targetTable.rows];
         while (newRows.length <= rowIdx) {
-            newRows.push(targetTable.headers.map(() => ''));
+            newRows.push(emptyRow(targetTable.headers.length));
         }
 
         // Ensure row has enough columns
-        const row = [...newRows[rowIdx]];
-        while (row.length <= colIdx) {
-            row.push('');
-        }
+        const row = padRow([...newRows[rowIdx]], colIdx + 1);
 
         // Update the cell value
         row[colIdx] = escapedValue;
         newRows[rowIdx] = row;
 
-        const newTable = new Table({ ...targetTable, rows: newRows });
-        newTables[tableIdx] = newTable;
-        return new Sheet({ ...sheet, tables: newTables });
+        return new Table({ ...targetTable, rows: newRows });
+    });
+}
+
+/**
+ * Update several cells of one table. Equivalent to calling updateCell for each
+ * entry in turn, but the table is copied and the markdown regenerated once.
+ * An invalid header column fails the whole batch.
+ */
+export function updateCells(
+    context: EditorContext,
+    sheetIdx: number,
+    tableIdx: number,
+    cells: CellUpdate[]
+): UpdateResult {
+    return applyTableUpdate(context, sheetIdx, tableIdx, (targetTable) => {
+        const rows = new CopyOnWriteRows(targetTable.rows);
+        let headers: string[] | null = null;
+        let changed = false;
+
+        for (const { rowIdx, colIdx, value } of cells) {
+            const escapedValue = escapePipe(value);
+
+            // Handle header row edit (rowIdx = -1)
+            if (rowIdx === -1) {
+                if (colIdx < 0 || colIdx >= targetTable.headers.length) {
+                    throw new Error('Invalid column index');
+                }
+                if ((headers ?? targetTable.headers)[colIdx] !== escapedValue) {
+                    headers ??= [...targetTable.headers];
+                    headers[colIdx] = escapedValue;
+                    changed = true;
+                }
+                continue;
+            }
+
+            // Re-entering the current value leaves the row untouched
+            const currentRow = rows.get(rowIdx);
+            if (currentRow && colIdx < currentRow.length && currentRow[colIdx] === escapedValue) {
+                continue;
+            }
+
+            // Ensure rows array has enough rows, and the row enough columns
+            while (rows.length <= rowIdx) {
+                rows.push(emptyRow(targetTable.headers.length));
+            }
+            const row = padRow(rows.edit(rowIdx), colIdx + 1);
+            row[colIdx] = escapedValue;
+            changed = true;
+        }
+
+        if (!changed) {
+            return targetTable;
+        }
+        return new Table({ ...targetTable, headers: headers ?? targetTable.headers, rows: rows.toArray() });
     });
 }
 
@@ -265,22 +351,46 @@ export function updateCell(
 // Row Operations
 // =============================================================================
 
+/**
+ * Byte mask of length `size` with 1 at every index in range; others are ignored.
+ */
+function indexMask(indices: number[], size: number): Uint8Array {
+    const mask = new Uint8Array(size);
+    for (const idx of indices) {
+        if (idx >= 0 && idx < size) {
+            mask[idx] = 1;
+        }
+    }
+    return mask;
+}
+
+/**
+ * Number of entries in an ascending array that are smaller than value (binary search).
+ */
+function countLessThan(sorted: number[], value: number): number {
+    let lo = 0;
+    let hi = sorted.length;
+    while (lo < hi) {
+        const mid = (lo + hi) >>> 1;
+        if (sorted[mid] < value) {
+            lo = mid + 1;
+        } else {
+            hi = mid;
+        }
+    }
+    return lo;
+}
+
 /**
  * Insert a new row at the specified index.
  */
 export function insertRow(context: EditorContext, sheetIdx: number, tableIdx: number, rowIdx: number): UpdateResult {
-    return applySheetUpdate(context, sheetIdx, (sheet) => {
-        const newTables = [...(sheet.tables ?? [])];
-        if (tableIdx < 0 || tableIdx >= newTables.length) {
-            throw new Error('Invalid table index');
-        }
-        const targetTable = newTables[tableIdx];
-        const emptyRow = targetTable.headers.map(() => '');
+    return applyTableUpdate(context, sheetIdx, tableIdx, (targetTable) => {
+        const newRow = emptyRow(targetTable.headers.length);
         const newRows = [...targetTable.rows];
         const insertPos = Math.max(0, Math.min(rowIdx, newRows.length));
-        newRows.splice(insertPos, 0, emptyRow);
-        newTables[tableIdx] = new Table({ ...targetTable, rows: newRows });
-        return new Sheet({ ...sheet, tables: newTables });
+        newRows.splice(insertPos, 0, newRow);
+        return new Table({ ...targetTable, rows: newRows });
     });
 }
 
@@ -293,24 +403,17 @@ export function deleteRows(
     tableIdx: number,
     rowIndices: number[]
 ): UpdateResult {
-    return applySheetUpdate(context, sheetIdx, (sheet) => {
-        const newTables = [...(sheet.tables ?? [])];
-        if (tableIdx < 0 || tableIdx >= newTables.length) {
-            throw new Error('Invalid table index');
+    return applyTableUpdate(context, sheetIdx, tableIdx, (targetTable) => {
+        const rowCount = targetTable.rows.length;
+        if (!rowIndices.some((idx) => idx >= 0 && idx < rowCount)) {
+            return targetTable;
         }
-        const targetTable = newTables[tableIdx];
-        const newRows = [...targetTable.rows];
 
-        // Sort indices in descending order to avoid shifting issues
-        const sortedIndices = [...rowIndices].sort((a, b) => b - a);
-        for (const idx of sortedIndices) {
-            if (idx >= 0 && idx < newRows.length) {
-                newRows.splice(idx, 1);
-            }
-        }
+        // Single filter pass; out-of-range indices simply never match
+        const deleted = indexMask(rowIndices, rowCount);
+        const newRows = targetTable.rows.filter((_row: string[], i: number) => !deleted[i]);
 
-        newTables[tableIdx] = new Table({ ...targetTable, rows: newRows });
-        return new Sheet({ ...sheet, tables: newTables });
+        return new Table({ ...targetTable, rows: newRows });
     });
 }
 
@@ -324,52 +427,66 @@ export function moveRows(
     rowIndices: number[],
     targetIndex: number
 ): UpdateResult {
-    return applySheetUpdate(context, sheetIdx, (sheet) => {
-        const newTables = [...(sheet.tables ?? [])];
-        if (tableIdx < 0 || tableIdx >= newTables.length) {
-            throw new Error('Invalid table index');
-        }
-        const targetTable = newTables[tableIdx];
-        const currentRows = [...targetTable.rows];
+    return applyTableUpdate(context, sheetIdx, tableIdx, (targetTable) => {
+        const currentRows: string[][] = targetTable.rows;
 
         // Identify rows to move
-        const uniqueIndices = [...new Set(rowIndices)].sort((a, b) => a - b);
-        const rowsToMove: Array<[number, string[]]> = [];
-        for (const idx of uniqueIndices) {
-            if (idx >= 0 && idx < currentRows.length) {
-                rowsToMove.push([idx, currentRows[idx]]);
-            }
-        }
+        const movingIndices = [...new Set(rowIndices)]
+            .filter((idx) => idx >= 0 && idx < currentRows.length)
+            .sort((a, b) => a - b);
 
-        if (!rowsToMove.length) {
-            return sheet;
+        if (!movingIndices.length) {
+            return targetTable;
         }
 
-        const movingRowsMap = new Map(rowsToMove);
+        const movingSet = new Set(movingIndices);
         const stayingRows: string[][] = [];
         for (let i = 0; i < currentRows.length; i++) {
-            if (!movingRowsMap.has(i)) {
+            if (!movingSet.has(i)) {
                 stayingRows.push(currentRows[i]);
             }
         }
 
-        // Determine insertion point
-        let insertIdxInStaying = 0;
-        for (let i = 0; i < targetIndex; i++) {
-            if (!movingRowsMap.has(i)) {
-                insertIdxInStaying++;
-            }
-        }
+        // Determine insertion point: non-moving positions before the target
+        const insertIdxInStaying = Math.max(0, targetIndex) - countLessThan(movingIndices, targetIndex);
 
-        const toInsert = rowsToMove.map(([, row]) => row);
-        const finalRows = [...stayingRows];
-        finalRows.splice(insertIdxInStaying, 0, ...toInsert);
+        // Assemble kept-before + moved + kept-after without shifting elements
+        const toInsert = movingIndices.map((idx) => currentRows[idx]);
+        const finalRows = stayingRows
+            .slice(0, insertIdxInStaying)
+            .concat(toInsert, stayingRows.slice(insertIdxInStaying));
 
-        newTables[tableIdx] = new Table({ ...targetTable, rows: finalRows });
-        return new Sheet({ ...sheet, tables: newTables });
+        return new Table({ ...targetTable, rows: finalRows });
     });
 }
 
+/**
+ * Values starting with a sign, an optional dot and a digit always parse as a number.
+ */
+const NUMERIC_PREFIX_PATTERN = /^[+-]?\.?\d/;
+
+/**
+ * Remove thousands separators, returning the value itself when it has none.
+ */
+function stripCommas(val: string): string {
+    return val.includes(',') ? val.replaceAll(',', '') : val;
+}
+
+/**
+ * Whether a trimmed, non-empty cell value parses as a number (thousands separators allowed).
+ */
+function isNumericValue(val: string): boolean {
+    // Fast path: a regex test avoids the comma-stripped copy for plain numbers
+    if (NUMERIC_PREFIX_PATTERN.test(val)) return true;
+    return !isNaN(parseFloat(stripCommas(val)));
+}
+
+/**
+ * Heuristic column types per rows array. Tables are immutable, so any row edit
+ * produces a new rows array and naturally misses this cache.
+ */
+const inferredColumnTypes = new WeakMap<string[][], Map<number, string>>();
+
 /**
  * Infer column type from data.
  */
@@ -384,6 +501,13 @@ function inferColumnType(rows: string[][], colIdx: number, metadata: Record<stri
         }
     }
 
+    // Heuristic result for these exact rows, if a previous sort already computed it
+    let cachedTypes = inferredColumnTypes.get(rows);
+    const cachedType = cachedTypes?.get(colIdx);
+    if (cachedType) {
+        return cachedType;
+    }
+
     // Heuristic: Check if all non-empty values are numeric
     let isNumber = true;
     let hasValue = false;
@@ -394,36 +518,40 @@ function inferColumnType(rows: string[][], colIdx: number, metadata: Record<stri
         if (!val) continue;
 
         hasValue = true;
-        const valClean = val.replace(/,/g, '');
-        if (isNaN(parseFloat(valClean))) {
+        if (!isNumericValue(val)) {
             isNumber = false;
             break;
         }
     }
 
-    if (hasValue && isNumber) {
-        return 'number';
+    const colType = hasValue && isNumber ? 'number' : 'string';
+
+    if (!cachedTypes) {
+        cachedTypes = new Map();
+        inferredColumnTypes.set(rows, cachedTypes);
     }
+    cachedTypes.set(colIdx, colType);
 
-    return 'string';
+    return colType;
 }
 
 /**
- * Get sort key for a row value.
+ * Get the numeric sort key for a row; empty and non-numeric values sort first.
  */
-function getSortKey(row: string[], colIdx: number, colType: string): number | string {
-    const val = colIdx < row.length ? row[colIdx] : '';
-
-    if (colType === 'number') {
-        const s = val.trim();
-        if (!s) {
-            return -Infinity;
-        }
-        const num = parseFloat(s.replace(/,/g, ''));
-        return isNaN(num) ? -Infinity : num;
+function getNumericSortKey(row: string[], colIdx: number): number {
+    const s = colIdx < row.length ? row[colIdx].trim() : '';
+    if (!s) {
+        return -Infinity;
     }
+    const num = parseFloat(stripCommas(s));
+    return isNaN(num) ? -Infinity : num;
+}
 
-    return val.toLowerCase();
+/**
+ * Get the case-insensitive text sort key for a row.
+ */
+function getTextSortKey(row: string[], colIdx: number): string {
+    return colIdx < row.length ? row[colIdx].toLowerCase() : '';
 }
 
 /**
@@ -436,31 +564,43 @@ export function sortRows(
     colIdx: number,
     ascending: boolean
 ): UpdateResult {
-    return applySheetUpdate(context, sheetIdx, (sheet) => {
-        const newTables = [...(sheet.tables ?? [])];
-        if (tableIdx < 0 || tableIdx >= newTables.length) {
-            throw new Error('Invalid table index');
-        }
-        const targetTable = newTables[tableIdx];
-        const rows = [...targetTable.rows];
+    return applyTableUpdate(context, sheetIdx, tableIdx, (targetTable) => {
+        const rows = targetTable.rows;
         const metadata = targetTable.metadata || {};
 
         const colType = inferColumnType(rows, colIdx, metadata);
 
-        rows.sort((a, b) => {
-            const keyA = getSortKey(a, colIdx, colType);
-            const keyB = getSortKey(b, colIdx, colType);
-
-            if (typeof keyA === 'number' && typeof keyB === 'number') {
-                return ascending ? keyA - keyB : keyB - keyA;
+        // Compute each sort key once, then sort an index permutation
+        let compare: (a: number, b: number) => number;
+        if (colType === 'number') {
+            // Numeric keys live in a typed array and compare without type checks
+            const keys = new Float64Array(rows.length);
+            for (let i = 0; i < rows.length; i++) {
+                keys[i] = getNumericSortKey(rows[i], colIdx);
             }
-            const strA = String(keyA);
-            const strB = String(keyB);
-            return ascending ? strA.localeCompare(strB) : strB.localeCompare(strA);
-        });
+            compare = ascending ? (a, b) => keys[a] - keys[b] : (a, b) => keys[b] - keys[a];
+        } else {
+            const keys = rows.map((row) => getTextSortKey(row, colIdx));
+            compare = ascending ? (a, b) => keys[a].localeCompare(keys[b]) : (a, b) => keys[b].localeCompare(keys[a]);
+        }
 
-        newTables[tableIdx] = new Table({ ...targetTable, rows });
-        return new Sheet({ ...sheet, tables: newTables });
+        const order = rows.map((_, i) => i);
+        order.sort(compare);
+
+        // Already in order: keep the table as is
+        if (order.every((rowIdx, i) => rowIdx === i)) {
+            return targetTable;
+        }
+
+        const sortedRows = order.map((i) => rows[i]);
+
+        // A permutation of the rows keeps every inferred column type
+        const cachedTypes = inferredColumnTypes.get(rows);
+        if (cachedTypes) {
+            inferredColumnTypes.set(sortedRows, cachedTypes);
+        }
+
+        return new Table({ ...targetTable, rows: sortedRows });
     });
 }
 
@@ -468,6 +608,21 @@ export function sortRows(
 // Column Operations
 // =============================================================================
 
+/**
+ * Visual metadata maps whose keys are column indices.
+ */
+const COLUMN_KEYED_VISUAL_KEYS = ['validation', 'columns', 'filters', 'formulas'];
+
+/**
+ * Whether any metadata entry is keyed by column index (and so follows column moves).
+ */
+function hasColumnKeyedMetadata(metadata: Record<string, unknown> | undefined): metadata is Record<string, unknown> {
+    if (!metadata) return false;
+    if (metadata.validation) return true;
+    const visual = metadata.visual as Record<string, unknown> | undefined;
+    return !!visual && COLUMN_KEYED_VISUAL_KEYS.some((key) => visual[key]);
+}
+
 /**
  * Shift column-based metadata keys.
  */
@@ -477,6 +632,11 @@ function shiftColumnMetadata(
 ): Record<string, unknown> {
     if (!metadata) return {};
 
+    // Nothing is keyed by column index: leave the metadata as is
+    if (!hasColumnKeyedMetadata(metadata)) {
+        return metadata;
+    }
+
     const newMetadata = { ...metadata };
 
     const shiftDict = (sourceDict: Record<string, unknown>): Record<string, unknown> => {
@@ -484,18 +644,12 @@ function shiftColumnMetadata(
         const newDict: Record<string, unknown> = {};
 
         for (const [k, v] of Object.entries(sourceDict)) {
-            const idx = parseInt(k, 10);
-            if (!isNaN(idx)) {
-                if (shiftMap.has(idx)) {
-                    const newIdx = shiftMap.get(idx);
-                    if (newIdx !== null) {
-                        newDict[String(newIdx)] = v;
-                    }
-                } else {
-                    newDict[k] = v;
-                }
-            } else {
+            // One lookup: undefined keeps the key, null drops it, a number moves it
+            const newIdx = shiftMap.get(parseInt(k, 10));
+            if (newIdx === undefined) {
                 newDict[k] = v;
+            } else if (newIdx !== null) {
+                newDict[String(newIdx)] = v;
             }
         }
         return newDict;
@@ -506,24 +660,15 @@ function shiftColumnMetadata(
         newMetadata.validation = shiftDict(newMetadata.validation as Record<string, unknown>);
     }
 
-    // Shift visual
-    if (newMetadata.visual) {
-        const visual = { ...(newMetadata.visual as Record<string, unknown>) };
-
-        if (visual.validation) {
-            visual.validation = shiftDict(visual.validation as Record<string, unknown>);
-        }
-        if (visual.columns) {
-            visual.columns = shiftDict(visual.columns as Record<string, unknown>);
-        }
-        if (visual.filters) {
-            visual.filters = shiftDict(visual.filters as Record<string, unknown>);
+    // Shift visual, copying it only when one of its column-keyed maps is present
+    const visual = newMetadata.visual as Record<string, unknown> | undefined;
+    const visualKeys = visual ? COLUMN_KEYED_VISUAL_KEYS.filter((key) => visual[key]) : [];
+    if (visual && visualKeys.length) {
+        const newVisual = { ...visual };
+        for (const key of visualKeys) {
+            newVisual[key] = shiftDict(visual[key] as Record<string, unknown>);
         }
-        if (visual.formulas) {
-            visual.formulas = shiftDict(visual.formulas as Record<string, unknown>);
-        }
-
-        newMetadata.visual = visual;
+        newMetadata.visual = newVisual;
     }
 
     return newMetadata;
@@ -539,41 +684,31 @@ export function insertColumn(
     colIdx: number,
     columnName = 'New Column'
 ): UpdateResult {
-    return applySheetUpdate(context, sheetIdx, (sheet) => {
-        const newTables = [...(sheet.tables ?? [])];
-        if (tableIdx < 0 || tableIdx >= newTables.length) {
-            throw new Error('Invalid table index');
-        }
-        const targetTable = newTables[tableIdx];
-
+    return applyTableUpdate(context, sheetIdx, tableIdx, (targetTable) => {
         const newHeaders = [...targetTable.headers];
         const insertPos = Math.max(0, Math.min(colIdx, newHeaders.length));
         newHeaders.splice(insertPos, 0, columnName);
 
         const newRows = targetTable.rows.map((row: string[]) => {
-            const newRow = [...row];
-            while (newRow.length < targetTable.headers.length) {
-                newRow.push('');
-            }
+            const newRow = padRow([...row], targetTable.headers.length);
             newRow.splice(insertPos, 0, '');
             return newRow;
         });
 
-        // Shift Metadata
-        const colCount = targetTable.headers.length;
-        const shiftMap = new Map<number, number | null>();
-        for (let i = 0; i < colCount; i++) {
-            shiftMap.set(i, i >= insertPos ? i + 1 : i);
-        }
-
         let newTable = new Table({ ...targetTable, headers: newHeaders, rows: newRows });
-        if (targetTable.metadata) {
+
+        // Shift Metadata (only built when some entry is keyed by column index)
+        if (hasColumnKeyedMetadata(targetTable.metadata)) {
+            const colCount = targetTable.headers.length;
+            const shiftMap = new Map<number, number | null>();
+            for (let i = 0; i < colCount; i++) {
+                shiftMap.set(i, i >= insertPos ? i + 1 : i);
+            }
             const newMeta = shiftColumnMetadata(targetTable.metadata, shiftMap);
             newTable = new Table({ ...newTable, metadata: newMeta });
         }
 
-        newTables[tableIdx] = newTable;
-        return new Sheet({ ...sheet, tables: newTables });
+        return newTable;
     });
 }
 
@@ -586,57 +721,43 @@ export function deleteColumns(
     tableIdx: number,
     colIndices: number[]
 ): UpdateResult {
-    return applySheetUpdate(context, sheetIdx, (sheet) => {
-        const newTables = [...(sheet.tables ?? [])];
-        if (tableIdx < 0 || tableIdx >= newTables.length) {
-            throw new Error('Invalid table index');
-        }
-        const targetTable = newTables[tableIdx];
-
-        const sortedIndices = [...colIndices].sort((a, b) => b - a);
-        const newHeaders = [...targetTable.headers];
-
-        for (const idx of sortedIndices) {
-            if (idx >= 0 && idx < newHeaders.length) {
-                newHeaders.splice(idx, 1);
-            }
+    return applyTableUpdate(context, sheetIdx, tableIdx, (targetTable) => {
+        // Filter headers and rows in one pass each instead of splicing per index
+        const colCount = targetTable.headers.length;
+        let maxWidth = colCount;
+        for (const row of targetTable.rows) {
+            maxWidth = Math.max(maxWidth, row.length);
         }
+        const deleted = indexMask(colIndices, maxWidth);
+        const keepColumn = (_value: string, i: number) => !deleted[i];
 
+        const newHeaders = targetTable.headers.filter(keepColumn);
         const newRows = targetTable.rows.map((row: string[]) => {
-            const newRow = [...row];
-            while (newRow.length < targetTable.headers.length) {
-                newRow.push('');
+            if (row.length >= colCount) {
+                return row.filter(keepColumn);
             }
-            for (const idx of sortedIndices) {
-                if (idx >= 0 && idx < newRow.length) {
-                    newRow.splice(idx, 1);
-                }
-            }
-            return newRow;
+            return padRow([...row], colCount).filter(keepColumn);
         });
 
-        // Shift Metadata
-        const deletedSet = new Set(sortedIndices);
-        const colCount = targetTable.headers.length;
-        const shiftMap = new Map<number, number | null>();
-        let targetPos = 0;
-        for (let i = 0; i < colCount; i++) {
-            if (deletedSet.has(i)) {
-                shiftMap.set(i, null);
-            } else {
-                shiftMap.set(i, targetPos);
-                targetPos++;
-            }
-        }
-
         let newTable = new Table({ ...targetTable, headers: newHeaders, rows: newRows });
-        if (targetTable.metadata) {
+
+        // Shift Metadata (only built when some entry is keyed by column index)
+        if (hasColumnKeyedMetadata(targetTable.metadata)) {
+            const shiftMap = new Map<number, number | null>();
+            let targetPos = 0;
+            for (let i = 0; i < colCount; i++) {
+                if (deleted[i]) {
+                    shiftMap.set(i, null);
+                } else {
+                    shiftMap.set(i, targetPos);
+                    targetPos++;
+                }
+            }
             const newMeta = shiftColumnMetadata(targetTable.metadata, shiftMap);
             newTable = new Table({ ...newTable, metadata: newMeta });
         }
 
-        newTables[tableIdx] = newTable;
-        return new Sheet({ ...sheet, tables: newTables });
+        return newTable;
     });
 }
 
@@ -650,70 +771,52 @@ export function moveColumns(
     colIndices: number[],
     targetIndex: number
 ): UpdateResult {
-    return applySheetUpdate(context, sheetIdx, (sheet) => {
-        const newTables = [...(sheet.tables ?? [])];
-        if (tableIdx < 0 || tableIdx >= newTables.length) {
-            throw new Error('Invalid table index');
-        }
-        const targetTable = newTables[tableIdx];
-        const headers = [...targetTable.headers];
-        const rows = targetTable.rows.map((r: string[]) => [...r]);
-
-        const reorderList = <T>(items: T[]): T[] => {
-            const uniqueIndices = [...new Set(colIndices)].sort((a, b) => a - b);
-            const movingMap = new Map<number, T>();
-            for (const idx of uniqueIndices) {
-                if (idx >= 0 && idx < items.length) {
-                    movingMap.set(idx, items[idx]);
-                }
-            }
-
-            if (!movingMap.size) return items;
-
-            const staying: T[] = [];
-            for (let i = 0; i < items.length; i++) {
-                if (!movingMap.has(i)) {
-                    staying.push(items[i]);
-                }
-            }
-
-            let insertIdx = 0;
-            for (let i = 0; i < targetIndex; i++) {
-                if (!movingMap.has(i)) {
-                    insertIdx++;
+    return applyTableUpdate(context, sheetIdx, tableIdx, (targetTable) => {
+        const uniqueIndices = [...new Set(colIndices)].sort((a, b) => a - b);
+
+        // Permutation of old positions for a list of the given length. Rows wider
+        // than the header only move the indices they actually contain.
+        const orders = new Map<number, number[]>();
+        const getOrder = (length: number): number[] => {
+            let order = orders.get(length);
+            if (!order) {
+                const moving = uniqueIndices.filter((idx) => idx >= 0 && idx < length);
+                const movingSet = new Set(moving);
+                const staying: number[] = [];
+                for (let i = 0; i < length; i++) {
+                    if (!movingSet.has(i)) {
+                        staying.push(i);
+                    }
                 }
+                const insertIdx = Math.max(0, targetIndex) - countLessThan(moving, targetIndex);
+                order = [...staying.slice(0, insertIdx), ...moving, ...staying.slice(insertIdx)];
+                orders.set(length, order);
             }
-
-            const toMove = uniqueIndices.filter((i) => movingMap.has(i)).map((i) => movingMap.get(i)!);
-            const final = [...staying];
-            final.splice(insertIdx, 0, ...toMove);
-            return final;
+            return order;
         };
 
-        const newHeaders = reorderList(headers);
-        const newRows = rows.map((row: string[]) => {
-            while (row.length < headers.length) {
-                row.push('');
-            }
-            return reorderList(row);
-        });
-
-        // Build shift map
-        const colsIndicesArr = Array.from({ length: headers.length }, (_, i) => i);
-        const newIndices = reorderList(colsIndicesArr);
-        const shiftMap = new Map<number, number | null>();
-        newIndices.forEach((oldIdx, newPos) => {
-            shiftMap.set(oldIdx, newPos);
+        const numCols = targetTable.headers.length;
+        const headerOrder = getOrder(numCols);
+        const newHeaders = headerOrder.map((i) => targetTable.headers[i]);
+        // One gather per row; short rows are padded with '' as part of it
+        const newRows = targetTable.rows.map((row: string[]) => {
+            const order = row.length > numCols ? getOrder(row.length) : headerOrder;
+            return order.map((i) => (i < row.length ? row[i] : ''));
         });
 
         let newTable = new Table({ ...targetTable, headers: newHeaders, rows: newRows });
-        if (targetTable.metadata) {
+
+        // Build shift map (only when some metadata entry is keyed by column index)
+        if (hasColumnKeyedMetadata(targetTable.metadata)) {
+            const shiftMap = new Map<number, number | null>();
+            headerOrder.forEach((oldIdx, newPos) => {
+                shiftMap.set(oldIdx, newPos);
+            });
             const newMeta = shiftColumnMetadata(targetTable.metadata, shiftMap);
             newTable = new Table({ ...newTable, metadata: newMeta });
         }
 
-        newTables[tableIdx] = newTable;
-        return new Sheet({ ...sheet, tables: newTables });
+        return newTable;
     });
 }
 
@@ -726,44 +829,85 @@ export function clearColumns(
     tableIdx: number,
     colIndices: number[]
 ): UpdateResult {
-    return applySheetUpdate(context, sheetIdx, (sheet) => {
-        const newTables = [...(sheet.tables ?? [])];
-        if (tableIdx < 0 || tableIdx >= newTables.length) {
-            throw new Error('Invalid table index');
-        }
-        const targetTable = newTables[tableIdx];
-        const indicesSet = new Set(colIndices);
+    return applyTableUpdate(context, sheetIdx, tableIdx, (targetTable) => {
+        // Resolve the valid target columns once instead of probing every cell
+        const clearIndices = [...new Set(colIndices)].filter((idx) => idx >= 0);
 
+        // Rows with nothing to clear are shared with the original table
+        let changed = false;
         const newRows = targetTable.rows.map((row: string[]) => {
-            const newRow = [...row];
-            for (let i = 0; i < newRow.length; i++) {
-                if (indicesSet.has(i)) {
-                    newRow[i] = '';
+            let newRow = row;
+            for (const idx of clearIndices) {
+                if (idx < row.length && row[idx] !== '') {
+                    if (newRow === row) {
+                        newRow = [...row];
+                        changed = true;
+                    }
+                    newRow[idx] = '';
                 }
             }
             return newRow;
         });
 
-        newTables[tableIdx] = new Table({ ...targetTable, rows: newRows });
-        return new Sheet({ ...sheet, tables: newTables });
+        if (!changed) {
+            return targetTable;
+        }
+
+        return new Table({ ...targetTable, rows: newRows });
     });
 }
 
 /**
- * Helper to update column metadata.
+ * Return a copy of `root` with `value` set at `path`. Only the objects along the
+ * path are copied; every sibling subtree is shared with the original.
  */
-function updateColumnMetadataHelper(table: Table, colIdx: number, key: string, value: unknown): Table {
-    const metadata = { ...(table.metadata || {}) };
-    const visual = { ...((metadata.visual as Record<string, unknown>) || {}) };
-    const columns = { ...((visual.columns as Record<string, unknown>) || {}) };
+function setMetadataPath(
+    root: Record<string, unknown> | undefined,
+    path: string[],
+    value: unknown
+): Record<string, unknown> {
+    // Missing levels start as fresh objects instead of spreading a throwaway {}
+    const newRoot = root ? { ...root } : {};
+    let parent: Record<string, unknown> = newRoot;
+    for (let i = 0; i < path.length - 1; i++) {
+        const current = parent[path[i]] as Record<string, unknown> | undefined;
+        const child = current ? { ...current } : {};
+        parent[path[i]] = child;
+        parent = child;
+    }
+    parent[path[path.length - 1]] = value;
+    return newRoot;
+}
 
-    const colStr = String(colIdx);
-    const colMeta = { ...((columns[colStr] as Record<string, unknown>) || {}) };
-    colMeta[key] = value;
-    columns[colStr] = colMeta;
-    visual.columns = columns;
-    metadata.visual = visual;
+/**
+ * Whether `root` already holds `value` at `path`. Objects from the webview are
+ * always fresh, so they are compared by content.
+ */
+function hasMetadataValue(root: Record<string, unknown> | undefined, path: string[], value: unknown): boolean {
+    let parent = root;
+    for (let i = 0; i < path.length - 1; i++) {
+        parent = parent?.[path[i]] as Record<string, unknown> | undefined;
+    }
+    const key = path[path.length - 1];
+    if (!parent || !(key in parent)) {
+        return false;
+    }
+    const current = parent[key];
+    if (current === value) {
+        return true;
+    }
+    return typeof value === 'object' && value !== null && JSON.stringify(current) === JSON.stringify(value);
+}
 
+/**
+ * Helper to update column metadata.
+ */
+function updateColumnMetadataHelper(table: Table, colIdx: number, key: string, value: unknown): Table {
+    const path = ['visual', 'columns', String(colIdx), key];
+    if (hasMetadataValue(table.metadata, path, value)) {
+        return table;
+    }
+    const metadata = setMetadataPath(table.metadata, path, value);
     return new Table({ ...table, metadata });
 }
 
@@ -777,14 +921,9 @@ export function updateColumnWidth(
     colIdx: number,
     width: number
 ): UpdateResult {
-    return applySheetUpdate(context, sheetIdx, (sheet) => {
-        const newTables = [...(sheet.tables ?? [])];
-        if (tableIdx < 0 || tableIdx >= newTables.length) {
-            throw new Error('Invalid table index');
-        }
-        newTables[tableIdx] = updateColumnMetadataHelper(newTables[tableIdx], colIdx, 'width', width);
-        return new Sheet({ ...sheet, tables: newTables });
-    });
+    return applyTableUpdate(context, sheetIdx, tableIdx, (table) =>
+        updateColumnMetadataHelper(table, colIdx, 'width', width)
+    );
 }
 
 /**
@@ -797,14 +936,9 @@ export function updateColumnFormat(
     colIdx: number,
     fmt: unknown
 ): UpdateResult {
-    return applySheetUpdate(context, sheetIdx, (sheet) => {
-        const newTables = [...(sheet.tables ?? [])];
-        if (tableIdx < 0 || tableIdx >= newTables.length) {
-            throw new Error('Invalid table index');
-        }
-        newTables[tableIdx] = updateColumnMetadataHelper(newTables[tableIdx], colIdx, 'format', fmt);
-        return new Sheet({ ...sheet, tables: newTables });
-    });
+    return applyTableUpdate(context, sheetIdx, tableIdx, (table) =>
+        updateColumnMetadataHelper(table, colIdx, 'format', fmt)
+    );
 }
 
 /**
@@ -817,20 +951,13 @@ export function updateColumnFilter(
     colIdx: number,
     hiddenValues: string[]
 ): UpdateResult {
-    return applySheetUpdate(context, sheetIdx, (sheet) => {
-        const newTables = [...(sheet.tables ?? [])];
-        if (tableIdx < 0 || tableIdx >= newTables.length) {
-            throw new Error('Invalid table index');
+    return applyTableUpdate(context, sheetIdx, tableIdx, (targetTable) => {
+        const path = ['visual', 'filters', String(colIdx)];
+        if (hasMetadataValue(targetTable.metadata, path, hiddenValues)) {
+            return targetTable;
         }
-        const targetTable = newTables[tableIdx];
-        const metadata = { ...(targetTable.metadata || {}) };
-        const visual = { ...((metadata.visual as Record<string, unknown>) || {}) };
-        const filters = { ...((visual.filters as Record<string, string[]>) || {}) };
-        filters[String(colIdx)] = hiddenValues;
-        visual.filters = filters;
-        metadata.visual = visual;
-        newTables[tableIdx] = new Table({ ...targetTable, metadata });
-        return new Sheet({ ...sheet, tables: newTables });
+        const metadata = setMetadataPath(targetTable.metadata, path, hiddenValues);
+        return new Table({ ...targetTable, metadata });
     });
 }
 
@@ -844,25 +971,113 @@ export function updateColumnAlign(
     colIdx: number,
     align: 'left' | 'center' | 'right'
 ): UpdateResult {
-    return applySheetUpdate(context, sheetIdx, (sheet) => {
-        const newTables = [...(sheet.tables ?? [])];
-        if (tableIdx < 0 || tableIdx >= newTables.length) {
-            throw new Error('Invalid table index');
+    return applyTableUpdate(context, sheetIdx, tableIdx, (targetTable) => {
+        // UIs often re-send the current alignment; with nothing to pad, that is a no-op
+        const current = targetTable.alignments;
+        if (current && current.length >= targetTable.headers.length && current[colIdx] === align) {
+            return targetTable;
         }
-        const targetTable = newTables[tableIdx];
-        const alignments = [...(targetTable.alignments || [])];
 
-        const numCols = targetTable.headers.length;
-        while (alignments.length < numCols) {
-            alignments.push('left');
-        }
+        const alignments = copyPaddedAlignments(targetTable);
 
         if (colIdx >= 0 && colIdx < alignments.length) {
             alignments[colIdx] = align;
         }
 
-        newTables[tableIdx] = new Table({ ...targetTable, alignments });
-        return new Sheet({ ...sheet, tables: newTables });
+        return new Table({ ...targetTable, alignments });
+    });
+}
+
+/**
+ * Copy a table's alignments, padding missing columns with 'left' in a single allocation.
+ */
+function copyPaddedAlignments(table: Table): NonNullable<Table['alignments']> {
+    const currentAlignments = table.alignments || [];
+    const numMissing = table.headers.length - currentAlignments.length;
+    const padding = numMissing > 0 ? new Array(numMissing).fill('left') : [];
+    return currentAlignments.concat(padding);
+}
+
+/**
+ * Update width, format, filter and alignment of many columns at once.
+ * Equivalent to calling the single-column updates in turn, but the metadata
+ * path is copied once for the whole batch instead of once per column.
+ */
+export function updateColumnsBulk(
+    context: EditorContext,
+    sheetIdx: number,
+    tableIdx: number,
+    updates: ColumnBulkUpdates
+): UpdateResult {
+    return applyTableUpdate(context, sheetIdx, tableIdx, (targetTable) => {
+        const widths = Object.entries(updates.widths ?? {});
+        const formats = Object.entries(updates.formats ?? {});
+        const filters = Object.entries(updates.filters ?? {});
+        const aligns = Object.entries(updates.aligns ?? {});
+
+        if (!widths.length && !formats.length && !filters.length && !aligns.length) {
+            return targetTable;
+        }
+
+        let metadata = targetTable.metadata;
+        if (widths.length || formats.length || filters.length) {
+            const newMetadata: Record<string, unknown> = metadata ? { ...metadata } : {};
+            const currentVisual = newMetadata.visual as Record<string, unknown> | undefined;
+            const visual: Record<string, unknown> = currentVisual ? { ...currentVisual } : {};
+
+            if (widths.length || formats.length) {
+                // Collect every change per column so each entry is copied once
+                const patches = new Map<string, Record<string, unknown>>();
+                const patchFor = (key: string): Record<string, unknown> => {
+                    let patch = patches.get(key);
+                    if (!patch) {
+                        patch = {};
+                        patches.set(key, patch);
+                    }
+                    return patch;
+                };
+                for (const [key, width] of widths) {
+                    patchFor(key).width = width;
+                }
+                for (const [key, fmt] of formats) {
+                    patchFor(key).format = fmt;
+                }
+
+                const currentColumns = visual.columns as Record<string, unknown> | undefined;
+                const columns: Record<string, unknown> = currentColumns ? { ...currentColumns } : {};
+                for (const [key, patch] of patches) {
+                    const current = columns[key] as Record<string, unknown> | undefined;
+                    columns[key] = current ? { ...current, ...patch } : patch;
+                }
+                visual.columns = columns;
+            }
+
+            if (filters.length) {
+                const currentFilters = visual.filters as Record<string, unknown> | undefined;
+                const newFilters: Record<string, unknown> = currentFilters ? { ...currentFilters } : {};
+                for (const [key, hiddenValues] of filters) {
+                    newFilters[key] = hiddenValues;
+                }
+                visual.filters = newFilters;
+            }
+
+            newMetadata.visual = visual;
+            metadata = newMetadata;
+        }
+
+        let alignments = targetTable.alignments;
+        if (aligns.length) {
+            const newAlignments = copyPaddedAlignments(targetTable);
+            for (const [key, align] of aligns) {
+                const colIdx = Number(key);
+                if (colIdx >= 0 && colIdx < newAlignments.length) {
+                    newAlignments[colIdx] = align;
+                }
+            }
+            alignments = newAlignments;
+        }
+
+        return new Table({ ...targetTable, metadata, alignments });
     });
 }
 
@@ -882,12 +1097,26 @@ export function pasteCells(
     newData: string[][],
     includeHeaders = false
 ): UpdateResult {
-    return applySheetUpdate(context, sheetIdx, (sheet) => {
-        const newTables = [...(sheet.tables ?? [])];
-        if (tableIdx < 0 || tableIdx >= newTables.length) {
-            throw new Error('Invalid table index');
+    return applyTableUpdate(context, sheetIdx, tableIdx, (targetTable) => {
+        // Single-cell paste into an existing cell of a rectangular table: nothing
+        // needs expanding or homogenizing, so only the touched row is rebuilt.
+        const width = targetTable.headers?.length ?? 0;
+        if (
+            !includeHeaders &&
+            newData.length === 1 &&
+            newData[0].length === 1 &&
+            startRow >= 0 &&
+            startRow < targetTable.rows.length &&
+            startCol >= 0 &&
+            startCol < width &&
+            targetTable.rows.every((r: string[]) => r.length === width)
+        ) {
+            const newRows = [...targetTable.rows];
+            const newRow = [...newRows[startRow]];
+            newRow[startCol] = escapePipe(newData[0][0]);
+            newRows[startRow] = newRow;
+            return new Table({ ...targetTable, rows: newRows });
         }
-        const targetTable = newTables[tableIdx];
 
         let pasteData = [...newData];
         const newHeaders = [...(targetTable.headers || [])];
@@ -906,11 +1135,11 @@ export function pasteCells(
             }
         }
 
-        const currentRows = targetTable.rows.map((r: string[]) => [...r]);
+        const currentRows = new CopyOnWriteRows(targetTable.rows);
         const rowsToPaste = pasteData.length;
 
         if (rowsToPaste === 0 && !includeHeaders) {
-            return sheet;
+            return targetTable;
         }
 
         // Max columns in pasted data
@@ -921,42 +1150,42 @@ export function pasteCells(
 
         // Expand rows
         const neededRows = startRow + rowsToPaste;
-        const baseWidth = Math.max(newHeaders.length, currentRows[0]?.length || 0);
+        const baseWidth = Math.max(newHeaders.length, currentRows.get(0)?.length || 0);
         while (currentRows.length < neededRows) {
-            currentRows.push(Array(baseWidth).fill(''));
+            currentRows.push(emptyRow(baseWidth));
         }
 
         // Update data & expand columns
         const maxColsNeeded = startCol + colsToPaste;
         for (let rOffset = 0; rOffset < pasteData.length; rOffset++) {
-            const targetR = startRow + rOffset;
-            while (currentRows[targetR].length < maxColsNeeded) {
-                currentRows[targetR].push('');
-            }
+            const row = padRow(currentRows.edit(startRow + rOffset), maxColsNeeded);
             for (let cOffset = 0; cOffset < pasteData[rOffset].length; cOffset++) {
-                const targetC = startCol + cOffset;
-                currentRows[targetR][targetC] = escapePipe(pasteData[rOffset][cOffset]);
+                row[startCol + cOffset] = escapePipe(pasteData[rOffset][cOffset]);
             }
         }
 
-        // Homogenize row lengths and headers
-        let globalMaxWidth = 0;
-        for (const r of currentRows) {
-            globalMaxWidth = Math.max(globalMaxWidth, r.length);
+        // Homogenize row lengths and headers. The padding pass only runs when some
+        // row is narrower than the widest one, so interior pastes skip it.
+        let globalMaxWidth = newHeaders.length;
+        let minWidth = Infinity;
+        for (let r = 0; r < currentRows.length; r++) {
+            const width = currentRows.get(r).length;
+            globalMaxWidth = Math.max(globalMaxWidth, width);
+            minWidth = Math.min(minWidth, width);
         }
-        globalMaxWidth = Math.max(globalMaxWidth, newHeaders.length);
 
-        for (const r of currentRows) {
-            while (r.length < globalMaxWidth) {
-                r.push('');
+        if (minWidth < globalMaxWidth) {
+            for (let r = 0; r < currentRows.length; r++) {
+                if (currentRows.get(r).length < globalMaxWidth) {
+                    padRow(currentRows.edit(r), globalMaxWidth);
+                }
             }
         }
         while (newHeaders.length < globalMaxWidth) {
             newHeaders.push(`Col ${newHeaders.length + 1}`);
         }
 
-        newTables[tableIdx] = new Table({ ...targetTable, headers: newHeaders, rows: currentRows });
-        return new Sheet({ ...sheet, tables: newTables });
+        return new Table({ ...targetTable, headers: newHeaders, rows: currentRows.toArray() });
     });
 }
 
@@ -971,29 +1200,23 @@ export function moveCells(
     destRow: number,
     destCol: number
 ): UpdateResult {
-    return applySheetUpdate(context, sheetIdx, (sheet) => {
-        const newTables = [...(sheet.tables ?? [])];
-        if (tableIdx < 0 || tableIdx >= newTables.length) {
-            throw new Error('Invalid table index');
-        }
-        const targetTable = newTables[tableIdx];
-
+    return applyTableUpdate(context, sheetIdx, tableIdx, (targetTable) => {
         const { minR, maxR, minC, maxC } = srcRange;
 
         // Check for no-op
         if (minR === destRow && minC === destCol) {
-            return sheet;
+            return targetTable;
         }
 
-        const currentRows = targetTable.rows.map((r: string[]) => [...r]);
+        const currentRows = new CopyOnWriteRows(targetTable.rows);
 
         // Extract source data
         const srcData: string[][] = [];
         for (let r = minR; r <= maxR; r++) {
             const rowData: string[] = [];
             for (let c = minC; c <= maxC; c++) {
-                if (r < currentRows.length && c < currentRows[r].length) {
-                    rowData.push(currentRows[r][c]);
+                if (r < currentRows.length && c < currentRows.get(r).length) {
+                    rowData.push(currentRows.get(r)[c]);
                 } else {
                     rowData.push('');
                 }
@@ -1006,24 +1229,24 @@ export function moveCells(
 
         // Expand grid if needed for destination
         const neededRows = destRow + height;
-        const numCols = targetTable.headers.length || currentRows[0]?.length || 0;
+        const numCols = targetTable.headers.length || currentRows.get(0)?.length || 0;
         const neededCols = destCol + width;
 
         while (currentRows.length < neededRows) {
-            currentRows.push(Array(numCols).fill(''));
+            currentRows.push(emptyRow(numCols));
         }
 
-        for (const row of currentRows) {
-            while (row.length < neededCols) {
-                row.push('');
+        for (let r = 0; r < currentRows.length; r++) {
+            if (currentRows.get(r).length < neededCols) {
+                padRow(currentRows.edit(r), neededCols);
             }
         }
 
         // Clear source cells
         for (let r = minR; r <= maxR; r++) {
             for (let c = minC; c <= maxC; c++) {
-                if (r < currentRows.length && c < currentRows[r].length) {
-                    currentRows[r][c] = '';
+                if (r < currentRows.length && c < currentRows.get(r).length) {
+                    currentRows.edit(r)[c] = '';
                 }
             }
         }
@@ -1031,11 +1254,10 @@ export function moveCells(
         // Place at destination
         for (let rOff = 0; rOff < srcData.length; rOff++) {
             for (let cOff = 0; cOff < srcData[rOff].length; cOff++) {
-                currentRows[destRow + rOff][destCol + cOff] = srcData[rOff][cOff];
+                currentRows.edit(destRow + rOff)[destCol + cOff] = srcData[rOff][cOff];
             }
         }
 
-        newTables[tableIdx] = new Table({ ...targetTable, rows: currentRows });
-        return new Sheet({ ...sheet, tables: newTables });
+        return new Table({ ...targetTable, rows: currentRows.toArray() });
     });
 }
@@ -3,9 +3,30 @@
  * Converted from python-modules/src/md_spreadsheet_editor/services/workbook.py
  */
 
-import { Workbook, Sheet } from 'md-spreadsheet-parser';
+import { Workbook, Sheet, Table, MultiTableParsingSchema } from 'md-spreadsheet-parser';
 import type { EditorContext } from '../context';
 import type { UpdateResult, TabOrderItem, EditorConfig } from '../types';
+import { splitLines, scanTopLevelHeaders } from '../utils/lines';
+import { getHeaderLevel, isScanCandidate } from '../utils/structure';
+import { parseEditorConfig } from '../utils/config';
+
+const HASH = 0x23;
+
+// Last rendered workbook. Workbooks are replaced rather than mutated, so the
+// instance and schema identify the output and repeated renders are free.
+let markdownCache: { workbook: Workbook; schema: MultiTableParsingSchema; markdown: string } | null = null;
+
+/**
+ * Render a workbook to markdown, reusing the previous result for the same workbook and schema.
+ */
+export function workbookToMarkdown(workbook: Workbook, schema: MultiTableParsingSchema): string {
+    if (markdownCache && markdownCache.workbook === workbook && markdownCache.schema === schema) {
+        return markdownCache.markdown;
+    }
+    const markdown = workbook.toMarkdown(schema);
+    markdownCache = { workbook, schema, markdown };
+    return markdown;
+}
 
 /**
  * Initialize tab_order by parsing the structure of the markdown document.
@@ -15,7 +36,7 @@ export function initializeTabOrderFromStructure(
     config: string | null,
     numSheets: number
 ): TabOrderItem[] {
-    const configDict: EditorConfig = config ? JSON.parse(config) : {};
+    const configDict: EditorConfig = parseEditorConfig(config);
     const rootMarker = configDict.rootMarker ?? '# Tables';
 
     if (!mdText) {
@@ -26,30 +47,21 @@ export function initializeTabOrderFromStructure(
         }));
     }
 
-    const lines = mdText.split('\n');
     const tabOrder: TabOrderItem[] = [];
     let docIndex = 0;
     let workbookFound = false;
-    let inCodeBlock = false;
-
-    for (const line of lines) {
-        if (line.trim().startsWith('```')) {
-            inCodeBlock = !inCodeBlock;
-        }
 
-        if (!inCodeBlock && line.startsWith('# ') && !line.startsWith('## ')) {
-            const stripped = line.trim();
-            if (stripped === rootMarker) {
-                // Workbook section - add all sheets at this position
-                workbookFound = true;
-                for (let i = 0; i < numSheets; i++) {
-                    tabOrder.push({ type: 'sheet', index: i });
-                }
-            } else {
-                // Document section
-                tabOrder.push({ type: 'document', index: docIndex });
-                docIndex++;
+    for (const header of scanTopLevelHeaders(splitLines(mdText), rootMarker)) {
+        if (header.isWorkbook) {
+            // Workbook section - add all sheets at this position
+            workbookFound = true;
+            for (let i = 0; i < numSheets; i++) {
+                tabOrder.push({ type: 'sheet', index: i });
             }
+        } else {
+            // Document section
+            tabOrder.push({ type: 'document', index: docIndex });
+            docIndex++;
         }
     }
 
@@ -69,38 +81,73 @@ export function initializeTabOrderFromStructure(
  */
 export function updateWorkbookTabOrder(context: EditorContext, tabOrder: TabOrderItem[] | null): UpdateResult {
     const wbTransform = (wb: Workbook): Workbook => {
-        const currentMetadata = wb.metadata ? { ...wb.metadata } : {};
         if (tabOrder === null) {
             // Delete tab_order when not needed
-            delete currentMetadata.tab_order;
-        } else {
-            currentMetadata.tab_order = tabOrder;
+            const { tab_order: _tabOrder, ...metadata } = wb.metadata ?? {};
+            return new Workbook({ ...wb, metadata });
         }
         return new Workbook({
             ...wb,
-            metadata: currentMetadata
+            metadata: { ...wb.metadata, tab_order: tabOrder }
         });
     };
 
     return updateWorkbook(context, wbTransform);
 }
 
+// Last workbook range. One operation looks up the range of the same text
+// several times (section moves, tab_order cleanup, the replacement range).
+let workbookRangeCache: {
+    mdText: string;
+    rootMarker: string;
+    sheetHeaderLevel: number;
+    range: [number, number];
+} | null = null;
+
 /**
  * Get the line range of the workbook section in markdown.
  */
 export function getWorkbookRange(mdText: string, rootMarker: string, sheetHeaderLevel: number): [number, number] {
-    const lines = mdText.split('\n');
+    const cache = workbookRangeCache;
+    if (
+        cache &&
+        cache.mdText === mdText &&
+        cache.rootMarker === rootMarker &&
+        cache.sheetHeaderLevel === sheetHeaderLevel
+    ) {
+        // Copy so callers cannot disturb the cached entry
+        return [cache.range[0], cache.range[1]];
+    }
+    const range = scanWorkbookRange(mdText, rootMarker, sheetHeaderLevel);
+    workbookRangeCache = { mdText, rootMarker, sheetHeaderLevel, range };
+    return [range[0], range[1]];
+}
+
+/**
+ * Scan the markdown for the root marker and the header that ends the workbook.
+ */
+function scanWorkbookRange(mdText: string, rootMarker: string, sheetHeaderLevel: number): [number, number] {
+    const lines = splitLines(mdText);
     let startLine = 0;
     let found = false;
     let inCodeBlock = false;
 
-    if (rootMarker) {
+    if (rootMarker && !mdText.includes(rootMarker)) {
+        // No line can trim to a marker the text does not contain
+        startLine = lines.length;
+    } else if (rootMarker) {
+        const markerCode = rootMarker.charCodeAt(0);
         for (let i = 0; i < lines.length; i++) {
             const line = lines[i];
-            if (line.trim().startsWith('```')) {
+            // Plain text lines can be neither a fence nor the marker: skip the trim
+            if (!isScanCandidate(line, 0, markerCode)) {
+                continue;
+            }
+            const stripped = line.trim();
+            if (stripped.startsWith('```')) {
                 inCodeBlock = !inCodeBlock;
             }
-            if (!inCodeBlock && line.trim() === rootMarker) {
+            if (!inCodeBlock && stripped === rootMarker) {
                 startLine = i;
                 found = true;
                 break;
@@ -114,27 +161,18 @@ export function getWorkbookRange(mdText: string, rootMarker: string, sheetHeader
 
     let endLine = lines.length;
 
-    const getLevel = (s: string): number => {
-        let lvl = 0;
-        for (const c of s) {
-            if (c === '#') {
-                lvl++;
-            } else {
-                break;
-            }
-        }
-        return lvl;
-    };
-
     inCodeBlock = false;
     for (let i = startLine + 1; i < lines.length; i++) {
+        if (!isScanCandidate(lines[i], 0, HASH)) {
+            continue;
+        }
         const line = lines[i].trim();
         if (line.startsWith('```')) {
             inCodeBlock = !inCodeBlock;
         }
 
         if (!inCodeBlock && line.startsWith('#')) {
-            const lvl = getLevel(line);
+            const lvl = getHeaderLevel(line);
             if (lvl < sheetHeaderLevel) {
                 endLine = i;
                 break;
@@ -155,7 +193,10 @@ export function updateWorkbook(context: EditorContext, transformFunc: (wb: Workb
 
     try {
         const newWorkbook = transformFunc(context.workbook);
-        context.updateWorkbook(newWorkbook);
+        // Workbooks are immutable: the same instance back means nothing changed
+        if (newWorkbook !== context.workbook) {
+            context.updateWorkbook(newWorkbook);
+        }
         return generateAndGetRange(context);
     } catch (e) {
         return { error: String(e) };
@@ -179,37 +220,27 @@ export function generateAndGetRange(context: EditorContext): UpdateResult {
 
         // Parse file structure from mdText to get true natural order
         const mdText = context.mdText;
-        const configDict = context.config ? JSON.parse(context.config) : {};
+        const configDict: EditorConfig = parseEditorConfig(context.config);
         const rootMarker = configDict.rootMarker ?? '# Tables';
         const sheetHeaderLevel = configDict.sheetHeaderLevel ?? 2;
 
         // Get workbook position in file
         const [wbStart, wbEnd] = getWorkbookRange(mdText, rootMarker, sheetHeaderLevel);
-        const lines = mdText.split('\n');
 
         // Find docs before and after WB in the ACTUAL FILE
         const docsBeforeWb: number[] = [];
         const docsAfterWb: number[] = [];
         let docIdx = 0;
-        let inCodeBlock = false;
 
-        for (let i = 0; i < lines.length; i++) {
-            const line = lines[i];
-            if (line.trim().startsWith('```')) {
-                inCodeBlock = !inCodeBlock;
-            }
-
-            if (!inCodeBlock && line.startsWith('# ') && !line.startsWith('## ')) {
-                const stripped = line.trim();
-                if (stripped !== rootMarker) {
-                    // This is a document section
-                    if (i < wbStart) {
-                        docsBeforeWb.push(docIdx);
-                    } else if (i >= wbEnd) {
-                        docsAfterWb.push(docIdx);
-                    }
-                    docIdx++;
+        for (const header of scanTopLevelHeaders(splitLines(mdText), rootMarker)) {
+            if (!header.isWorkbook) {
+                // This is a document section
+                if (header.line < wbStart) {
+                    docsBeforeWb.push(docIdx);
+                } else if (header.line >= wbEnd) {
+                    docsAfterWb.push(docIdx);
                 }
+                docIdx++;
             }
         }
 
@@ -250,17 +281,17 @@ export function generateAndGetRange(context: EditorContext): UpdateResult {
     let newMd = '';
     if (cleanWorkbook && (cleanWorkbook.sheets ?? []).length > 0) {
         if (schema) {
-            newMd = cleanWorkbook.toMarkdown(schema);
+            newMd = workbookToMarkdown(cleanWorkbook, schema);
         }
     }
 
     // Determine replacement range
-    const configDict: EditorConfig = config ? JSON.parse(config) : {};
+    const configDict: EditorConfig = parseEditorConfig(config);
     const rootMarker = configDict.rootMarker ?? '# Tables';
     const sheetHeaderLevel = configDict.sheetHeaderLevel ?? 2;
 
     const [startLine, rawEndLine] = getWorkbookRange(mdText, rootMarker, sheetHeaderLevel);
-    const lines = mdText.split('\n');
+    const lines = splitLines(mdText);
 
     let endLine = rawEndLine;
     let endCol = 0;
@@ -314,74 +345,133 @@ export function reorderTabMetadata(
         return wb;
     }
 
-    const metadata = { ...wb.metadata };
-    const tabOrder: TabOrderItem[] = [...(metadata.tab_order || [])];
+    const currentOrder: readonly TabOrderItem[] = wb.metadata.tab_order || [];
 
-    if (!tabOrder.length) {
+    if (!currentOrder.length) {
         return wb;
     }
 
-    const indicesInTabOrder = tabOrder.filter((item) => item.type === itemType).map((item) => item.index);
+    // Highest index of this item type, found in a single pass
+    let hasItems = false;
+    let maxIndex = -Infinity;
+    for (const item of currentOrder) {
+        if (item.type === itemType) {
+            hasItems = true;
+            if (item.index > maxIndex) {
+                maxIndex = item.index;
+            }
+        }
+    }
 
-    if (!indicesInTabOrder.length) {
+    if (!hasItems) {
         return wb;
     }
 
-    let maxIndex = Math.max(...indicesInTabOrder);
     maxIndex = Math.max(maxIndex, fromIdx);
     const clampedToIdx = Math.min(toIdx, maxIndex);
 
-    const dummyList = Array.from({ length: maxIndex + 1 }, (_, i) => i);
+    // Moving one entry of [0, maxIndex] from fromIdx to insertIdx shifts the
+    // entries in between by one; everything else keeps its index.
+    const insertIdx = Math.max(0, Math.min(clampedToIdx, maxIndex));
 
-    if (fromIdx < dummyList.length) {
-        const movedItem = dummyList.splice(fromIdx, 1)[0];
-        const insertIdx = Math.max(0, Math.min(clampedToIdx, dummyList.length));
-        dummyList.splice(insertIdx, 0, movedItem);
+    // Dropped back where it started without a tab slot: nothing moves
+    if (insertIdx === fromIdx && targetTabOrderIndex === null) {
+        return wb;
     }
+    const remap = (i: number): number => {
+        if (i === fromIdx) {
+            return insertIdx;
+        }
+        if (fromIdx < insertIdx) {
+            return fromIdx < i && i <= insertIdx ? i - 1 : i;
+        }
+        return insertIdx <= i && i < fromIdx ? i + 1 : i;
+    };
 
-    const newIndexMap = new Map<number, number>();
-    dummyList.forEach((old, newPos) => {
-        newIndexMap.set(old, newPos);
-    });
-
-    let movedTabOrderItem: TabOrderItem | null = null;
+    // Copy only once we know the order changes
+    const tabOrder = [...currentOrder];
 
-    for (const item of tabOrder) {
+    // Rewrite indices and locate the moved item in the same pass
+    let movedPos = -1;
+    let changed = false;
+    for (let pos = 0; pos < tabOrder.length; pos++) {
+        const item = tabOrder[pos];
         if (item.type === itemType) {
             const oldIdx = item.index;
-            if (newIndexMap.has(oldIdx)) {
-                item.index = newIndexMap.get(oldIdx)!;
+            const newIdx = remap(oldIdx);
+            if (newIdx !== oldIdx) {
+                // Copy on write: items are shared with the previous workbook's metadata
+                tabOrder[pos] = { ...item, index: newIdx };
+                changed = true;
             }
 
             if (oldIdx === fromIdx) {
-                movedTabOrderItem = item;
+                movedPos = pos;
             }
         }
     }
 
-    if (movedTabOrderItem && targetTabOrderIndex !== null) {
-        const currPos = tabOrder.indexOf(movedTabOrderItem);
-        if (currPos >= 0) {
-            tabOrder.splice(currPos, 1);
-
-            // Adjust target index if we removed an item that was before the target
-            let adjustedTarget = targetTabOrderIndex;
-            if (currPos < targetTabOrderIndex) {
-                adjustedTarget -= 1;
+    let newTabOrder = tabOrder;
+    if (movedPos >= 0 && targetTabOrderIndex !== null) {
+        // Adjust target index if we removed an item that was before the target
+        let adjustedTarget = targetTabOrderIndex;
+        if (movedPos < targetTabOrderIndex) {
+            adjustedTarget -= 1;
+        }
+        const safeTarget = Math.max(0, Math.min(adjustedTarget, tabOrder.length - 1));
+
+        // Rebuild the order once with the moved item dropped into its new slot
+        if (safeTarget !== movedPos) {
+            const movedItem = tabOrder[movedPos];
+            newTabOrder = [];
+            for (let pos = 0; pos < tabOrder.length; pos++) {
+                if (pos === movedPos) {
+                    continue;
+                }
+                if (newTabOrder.length === safeTarget) {
+                    newTabOrder.push(movedItem);
+                }
+                newTabOrder.push(tabOrder[pos]);
             }
-
-            const safeTarget = Math.max(0, Math.min(adjustedTarget, tabOrder.length));
-            tabOrder.splice(safeTarget, 0, movedTabOrderItem);
+            if (newTabOrder.length === safeTarget) {
+                newTabOrder.push(movedItem);
+            }
+            changed = true;
         }
     }
 
-    metadata.tab_order = tabOrder;
+    // Same indices in the same slots (e.g. a cancelled drag): keep the workbook
+    if (!changed) {
+        return wb;
+    }
+
     return new Workbook({
         ...wb,
-        metadata
+        metadata: { ...wb.metadata, tab_order: newTabOrder }
     });
 }
 
+/**
+ * Drop the tab_order entry of a deleted sheet or document and shift the later
+ * indices of that type down by one, in a single pass.
+ */
+export function removeTabOrderEntry(
+    tabOrder: readonly TabOrderItem[],
+    itemType: 'sheet' | 'document',
+    removedIdx: number
+): TabOrderItem[] {
+    const result: TabOrderItem[] = [];
+    for (const item of tabOrder) {
+        if (item.type !== itemType || item.index < removedIdx) {
+            result.push(item);
+        } else if (item.index > removedIdx) {
+            // Copy on write: items are shared with the previous workbook's metadata
+            result.push({ ...item, index: item.index - 1 });
+        }
+    }
+    return result;
+}
+
 /**
  * Apply a sheet-level update using a transform function.
  */
@@ -391,13 +481,19 @@ export function applySheetUpdate(
     transformFunc: (sheet: Sheet) => Sheet
 ): UpdateResult {
     const wbTransform = (wb: Workbook): Workbook => {
-        const newSheets = [...(wb.sheets ?? [])];
-        if (sheetIdx < 0 || sheetIdx >= newSheets.length) {
+        const sheets = wb.sheets ?? [];
+        if (sheetIdx < 0 || sheetIdx >= sheets.length) {
             throw new Error('Invalid sheet index');
         }
 
-        const targetSheet = newSheets[sheetIdx];
+        const targetSheet = sheets[sheetIdx];
         const newSheet = transformFunc(targetSheet);
+        if (newSheet === targetSheet) {
+            // Unchanged sheet: keep the workbook so its rendered markdown is reused
+            return wb;
+        }
+
+        const newSheets = [...sheets];
         newSheets[sheetIdx] = newSheet;
 
         return new Workbook({
@@ -408,3 +504,46 @@ export function applySheetUpdate(
 
     return updateWorkbook(context, wbTransform);
 }
+
+/**
+ * Apply a table-level update using a transform function.
+ */
+export function applyTableUpdate(
+    context: EditorContext,
+    sheetIdx: number,
+    tableIdx: number,
+    transformFunc: (table: Table) => Table
+): UpdateResult {
+    // The sheet is only rebuilt when the table actually changed
+    const wbTransform = (wb: Workbook): Workbook => {
+        const sheets = wb.sheets ?? [];
+        if (sheetIdx < 0 || sheetIdx >= sheets.length) {
+            throw new Error('Invalid sheet index');
+        }
+
+        const targetSheet = sheets[sheetIdx];
+        const tables = targetSheet.tables ?? [];
+        if (tableIdx < 0 || tableIdx >= tables.length) {
+            throw new Error('Invalid table index');
+        }
+
+        const newTable = transformFunc(tables[tableIdx]);
+        if (newTable === tables[tableIdx]) {
+            // Unchanged table: keep the workbook so its rendered markdown is reused
+            return wb;
+        }
+
+        // Copy only the path to the table; sibling sheets and tables are shared
+        const newTables = [...tables];
+        newTables[tableIdx] = newTable;
+        const newSheets = [...sheets];
+        newSheets[sheetIdx] = new Sheet({ ...targetSheet, tables: newTables });
+
+        return new Workbook({
+            ...wb,
+            sheets: newSheets
+        });
+    };
+
+    return updateWorkbook(context, wbTransform);
+}
@@ -203,6 +203,33 @@ export interface CellRange {
     maxC: number;
 }
 
+// =============================================================================
+// Cell Updates (for update_cells)
+// =============================================================================
+
+/**
+ * A single cell edit; rowIdx -1 addresses the header row.
+ */
+export interface CellUpdate {
+    rowIdx: number;
+    colIdx: number;
+    value: string;
+}
+
+// =============================================================================
+// Column Bulk Updates (for update_columns_bulk)
+// =============================================================================
+
+/**
+ * Per-column changes keyed by column index, applied in one table update.
+ */
+export interface ColumnBulkUpdates {
+    widths?: Record<number, number>;
+    formats?: Record<number, unknown>;
+    filters?: Record<number, string[]>;
+    aligns?: Record<number, 'left' | 'center' | 'right'>;
+}
+
 // =============================================================================
 // Structure Section (from extract_structure)
 // =============================================================================
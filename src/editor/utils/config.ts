@@ -0,0 +1,25 @@
+/**
+ * Editor config parsing shared by the context and services.
+ */
+
+import type { EditorConfig } from '../types';
+
+// Last parsed config. The config JSON is set once per document and re-read by
+// nearly every operation, so a single entry avoids reparsing it each time.
+let configCache: { raw: string; parsed: EditorConfig } | null = null;
+
+/**
+ * Parse the editor config JSON, reusing the previous result for the same string.
+ * The returned object is shared between callers and must not be modified.
+ */
+export function parseEditorConfig(config: string | null): EditorConfig {
+    if (!config) {
+        return {};
+    }
+    if (configCache && configCache.raw === config) {
+        return configCache.parsed;
+    }
+    const parsed: EditorConfig = JSON.parse(config);
+    configCache = { raw: config, parsed };
+    return parsed;
+}
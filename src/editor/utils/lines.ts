@@ -0,0 +1,65 @@
+/**
+ * Line and section scanning utilities shared by the editor services.
+ */
+
+// Last split text. A single operation splits the same md_text several times
+// (range lookup, section scan, regeneration), so one entry covers them all.
+let linesCache: { text: string; lines: readonly string[] } | null = null;
+
+/**
+ * Split markdown text into lines, reusing the previous split of the same text.
+ * The array is shared between callers: copy it before editing.
+ */
+export function splitLines(text: string): readonly string[] {
+    if (linesCache && linesCache.text === text) {
+        return linesCache.lines;
+    }
+    const lines = text.split('\n');
+    linesCache = { text, lines };
+    return lines;
+}
+
+const BACKTICK = 0x60;
+
+/**
+ * A level-1 header outside code blocks: the workbook root marker or a document title.
+ */
+export interface TopLevelHeader {
+    line: number;
+    isWorkbook: boolean;
+}
+
+// Last header scan. Document operations look up sections of the same lines
+// several times, and splitLines hands out the same array for the same text.
+let headersCache: { lines: readonly string[]; rootMarker: string; headers: readonly TopLevelHeader[] } | null = null;
+
+/**
+ * Find every level-1 ('# ') header outside fenced code blocks, in document order.
+ */
+export function scanTopLevelHeaders(lines: readonly string[], rootMarker: string): readonly TopLevelHeader[] {
+    if (headersCache && headersCache.lines === lines && headersCache.rootMarker === rootMarker) {
+        return headersCache.headers;
+    }
+
+    const headers: TopLevelHeader[] = [];
+    let inCodeBlock = false;
+
+    for (let i = 0; i < lines.length; i++) {
+        const line = lines[i];
+
+        // Only lines opening with a backtick, whitespace or non-ASCII can trim to a fence
+        const first = line.charCodeAt(0);
+        if (first === BACKTICK || first <= 0x20 || first > 0x7e) {
+            if (line.trim().startsWith('```')) {
+                inCodeBlock = !inCodeBlock;
+            }
+        }
+
+        if (!inCodeBlock && line.startsWith('# ')) {
+            headers.push({ line: i, isWorkbook: line.trim() === rootMarker });
+        }
+    }
+
+    headersCache = { lines, rootMarker, headers };
+    return headers;
+}
@@ -5,34 +5,98 @@
 
 import type { StructureSection, DocumentSection, WorkbookSection } from '../types';
 
+const HASH = 0x23;
+const BACKTICK = 0x60;
+const SPACE = 0x20;
+
+/**
+ * Count the leading '#' characters of a (trimmed) line.
+ */
+export function getHeaderLevel(line: string): number {
+    let level = 0;
+    while (level < line.length && line.charCodeAt(level) === HASH) {
+        level++;
+    }
+    return level;
+}
+
+/**
+ * Cheap first-character check: can the trimmed line starting at text[start] be
+ * a header, a code fence, or start with markerCode? Lines opening with any other
+ * printable ASCII character are rejected without allocating a trimmed copy.
+ */
+export function isScanCandidate(text: string, start: number, markerCode: number): boolean {
+    const code = text.charCodeAt(start);
+    if (code > 0x20 && code < 0x7f) {
+        return code === HASH || code === BACKTICK || code === markerCode;
+    }
+    // Empty, whitespace-led or non-ASCII lines need the full trim
+    return true;
+}
+
+/**
+ * Index of the end of the line starting at pos (the next '\n' or end of text).
+ * Callers walk the text with a cursor instead of materializing split('\n').
+ */
+function lineEnd(text: string, pos: number): number {
+    const nl = text.indexOf('\n', pos);
+    return nl === -1 ? text.length : nl;
+}
+
+// Last extracted structure. getState() is queried repeatedly against the same
+// markdown text, so a single-entry cache avoids rescanning and reserializing.
+let structureCache: { mdText: string; rootMarker: string; json: string } | null = null;
+
 /**
  * Extract document and workbook structure from markdown text.
  * Returns a JSON string of StructureSection array.
  */
 export function extractStructure(mdText: string, rootMarker: string): string {
-    const sections: StructureSection[] = [];
-    const lines = mdText.split('\n');
+    if (structureCache && structureCache.mdText === mdText && structureCache.rootMarker === rootMarker) {
+        return structureCache.json;
+    }
+    const json = scanStructure(mdText, rootMarker);
+    structureCache = { mdText, rootMarker, json };
+    return json;
+}
 
+/**
+ * Scan the markdown for top-level sections and serialize them.
+ */
+function scanStructure(mdText: string, rootMarker: string): string {
+    const sections: StructureSection[] = [];
     let currentType: 'document' | 'workbook' | null = null;
     let currentTitle: string | null = null;
-    let currentLines: string[] = [];
+    // Document content is the contiguous run of lines after its header, kept as
+    // offsets into mdText and sliced once when the section is flushed.
+    let contentStart = 0;
+    let contentEnd = -1;
     let inCodeBlock = false;
 
-    for (const line of lines) {
-        if (line.trim().startsWith('```')) {
+    const flushDocument = () => {
+        if (currentTitle && currentType === 'document') {
+            sections.push({
+                type: 'document',
+                title: currentTitle,
+                content: contentEnd < 0 ? '' : mdText.slice(contentStart, contentEnd)
+            } as DocumentSection);
+        }
+    };
+
+    for (let pos = 0; pos <= mdText.length; ) {
+        const start = pos;
+        const end = lineEnd(mdText, pos);
+        pos = end + 1;
+
+        if (isScanCandidate(mdText, start, BACKTICK) && mdText.slice(start, end).trim().startsWith('```')) {
             inCodeBlock = !inCodeBlock;
         }
 
-        if (!inCodeBlock && line.startsWith('# ') && !line.startsWith('## ')) {
+        if (!inCodeBlock && mdText.startsWith('# ', start) && !mdText.startsWith('## ', start)) {
             // Flush previous document section
-            if (currentTitle && currentType === 'document') {
-                sections.push({
-                    type: 'document',
-                    title: currentTitle,
-                    content: currentLines.join('\n')
-                } as DocumentSection);
-            }
+            flushDocument();
 
+            const line = mdText.slice(start, end);
             const stripped = line.trim();
             if (stripped === rootMarker) {
                 sections.push({ type: 'workbook' } as WorkbookSection);
@@ -42,22 +106,15 @@ export function extractStructure(mdText: string, rootMarker: string): string {
                 currentTitle = line.slice(2).trim();
                 currentType = 'document';
             }
-            currentLines = [];
-        } else {
-            if (currentType === 'document') {
-                currentLines.push(line);
-            }
+            contentStart = pos;
+            contentEnd = -1;
+        } else if (currentType === 'document') {
+            contentEnd = end;
         }
     }
 
     // Flush final document section
-    if (currentTitle && currentType === 'document') {
-        sections.push({
-            type: 'document',
-            title: currentTitle,
-            content: currentLines.join('\n')
-        } as DocumentSection);
-    }
+    flushDocument();
 
     return JSON.stringify(sections);
 }
@@ -72,27 +129,30 @@ export function augmentWorkbookMetadata(
     rootMarker: string,
     sheetHeaderLevel: number
 ): Record<string, unknown> {
-    const lines = mdText.split('\n');
-
     // Find root marker first to replicate parse_workbook skip logic
+    let startPos = 0;
     let startIndex = 0;
     let inCodeBlock = false;
 
     if (rootMarker) {
-        for (let i = 0; i < lines.length; i++) {
-            const line = lines[i];
-            if (line.trim().startsWith('```')) {
-                inCodeBlock = !inCodeBlock;
-            }
-            if (!inCodeBlock && line.trim() === rootMarker) {
-                startIndex = i + 1;
-                break;
+        const markerCode = rootMarker.charCodeAt(0);
+        for (let pos = 0, i = 0; pos <= mdText.length; i++) {
+            const end = lineEnd(mdText, pos);
+            if (isScanCandidate(mdText, pos, markerCode)) {
+                const stripped = mdText.slice(pos, end).trim();
+                if (stripped.startsWith('```')) {
+                    inCodeBlock = !inCodeBlock;
+                }
+                if (!inCodeBlock && stripped === rootMarker) {
+                    startPos = end + 1;
+                    startIndex = i + 1;
+                    break;
+                }
             }
+            pos = end + 1;
         }
     }
 
-    const headerPrefix = '#'.repeat(sheetHeaderLevel) + ' ';
-
     let currentSheetIdx = 0;
     inCodeBlock = false;
 
@@ -101,9 +161,14 @@ export function augmentWorkbookMetadata(
         return workbookDict;
     }
 
-    for (let idx = startIndex; idx < lines.length; idx++) {
-        const line = lines[idx];
-        const stripped = line.trim();
+    for (let pos = startPos, idx = startIndex; pos <= mdText.length; idx++) {
+        const start = pos;
+        const end = lineEnd(mdText, pos);
+        pos = end + 1;
+        if (!isScanCandidate(mdText, start, HASH)) {
+            continue;
+        }
+        const stripped = mdText.slice(start, end).trim();
 
         if (stripped.startsWith('```')) {
             inCodeBlock = !inCodeBlock;
@@ -113,22 +178,16 @@ export function augmentWorkbookMetadata(
             continue;
         }
 
+        // One '#' count answers both checks: 0 means the line is not a header
+        const level = getHeaderLevel(stripped);
+
         // Check for higher-level headers that would break workbook parsing
-        if (stripped.startsWith('#')) {
-            let level = 0;
-            for (const char of stripped) {
-                if (char === '#') {
-                    level++;
-                } else {
-                    break;
-                }
-            }
-            if (level < sheetHeaderLevel) {
-                break;
-            }
+        if (level > 0 && level < sheetHeaderLevel) {
+            break;
         }
 
-        if (stripped.startsWith(headerPrefix)) {
+        // Sheet header: exactly sheetHeaderLevel '#'s followed by a space
+        if (level === sheetHeaderLevel && stripped.charCodeAt(level) === SPACE) {
             if (currentSheetIdx < sheets.length) {
                 sheets[currentSheetIdx].header_line = idx;
                 currentSheetIdx++;
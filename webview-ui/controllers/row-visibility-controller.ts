@@ -42,19 +42,24 @@ export class RowVisibilityController {
         const visual = this.deps.getVisualMetadata();
         const filters = visual?.filters || {};
 
+        // Resolve each active filter once: column index plus a Set of hidden
+        // values, so every cell check is a hash lookup instead of a list scan
+        const activeFilters: Array<[number, Set<string>]> = [];
+        for (const [colStr, hiddenValues] of Object.entries(filters)) {
+            if (!hiddenValues || hiddenValues.length === 0) continue;
+            activeFilters.push([parseInt(colStr, 10), new Set(hiddenValues)]);
+        }
+
         const indices: number[] = [];
         for (let i = 0; i < rows.length; i++) {
             let visible = true;
             const row = rows[i];
 
             // Check all filters
-            for (const [colStr, hiddenValues] of Object.entries(filters)) {
-                if (!hiddenValues || hiddenValues.length === 0) continue;
-
-                const colIdx = parseInt(colStr, 10);
+            for (const [colIdx, hiddenSet] of activeFilters) {
                 if (colIdx >= 0 && colIdx < row.length) {
                     const cellValue = row[colIdx];
-                    if (hiddenValues.includes(cellValue)) {
+                    if (hiddenSet.has(cellValue)) {
                         visible = false;
                         break;
                     }
@@ -333,14 +333,24 @@ export class SpreadsheetService {
         // Start batch to group cell update + formula recalculations into single undo
         this.startBatch();
         try {
+            // One editor call for the whole range, so the markdown is regenerated once.
+            // Header cells past the last column are dropped here rather than failing
+            // the whole batch, so the rest of the range is still applied.
+            const table = startRow <= -1 ? this.getCurrentWorkbook()?.sheets[sheetIdx]?.tables[tableIdx] : undefined;
+            const headerCount = table?.headers?.length ?? 0;
+            const cells: editor.CellUpdate[] = [];
             for (let r = startRow; r <= endRow; r++) {
                 for (let c = startCol; c <= endCol; c++) {
-                    const result = editor.updateCell(sheetIdx, tableIdx, r, c, newValue);
-                    if (result) {
-                        this._postUpdateMessage(result);
+                    if (r === -1 && (c < 0 || c >= headerCount)) {
+                        continue;
                     }
+                    cells.push({ rowIdx: r, colIdx: c, value: newValue });
                 }
             }
+            const result = cells.length > 0 ? editor.updateCells(sheetIdx, tableIdx, cells) : null;
+            if (result) {
+                this._postUpdateMessage(result);
+            }
             // Trigger data change callback for formula recalculation (within same batch)
             this._onDataChanged?.();
         } catch (err) {
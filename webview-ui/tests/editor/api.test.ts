@@ -26,7 +26,8 @@ import {
     addDocument,
     renameDocument,
     deleteDocument,
-    generateAndGetRange
+    generateAndGetRange,
+    getEditorContext
 } from '../../../src/editor';
 
 // Sample markdown for testing
@@ -68,6 +69,15 @@ describe('Editor API', () => {
 
             expect(state.workbook).not.toBeNull();
         });
+
+        it('should reuse the same context instance across resets', () => {
+            const context = getEditorContext();
+            initializeWorkbook(SAMPLE_MD, SAMPLE_CONFIG);
+            resetContext();
+
+            expect(getEditorContext()).toBe(context);
+            expect(context.workbook).toBeNull();
+        });
     });
 
     describe('Sheet Operations', () => {
@@ -248,6 +258,17 @@ describe('Editor API', () => {
             expect(state.workbook.sheets[0].tables[0].rows[1][0]).toBe('Z');
             expect(state.workbook.sheets[0].tables[0].rows[1][1]).toBe('W');
         });
+
+        it('should paste a single cell without touching other rows', () => {
+            const result = pasteCells(0, 0, 1, 2, [['a|b']]);
+            expect(result.error).toBeUndefined();
+
+            const state = JSON.parse(getState());
+            expect(state.workbook.sheets[0].tables[0].rows).toEqual([
+                ['1', '2', '3'],
+                ['4', '5', 'a\\|b']
+            ]);
+        });
     });
 
     describe('Generate Markdown', () => {
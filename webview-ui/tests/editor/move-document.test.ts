@@ -49,6 +49,16 @@ Second document content.
         /**
          * Testing toAfterWorkbook movement
          */
+        it('should return the unchanged text when a document is dropped where it is', () => {
+            // Doc Zero already sits right before the workbook
+            const result = moveDocumentSection(0, null, false, true);
+
+            expect(result.error).toBeUndefined();
+            expect(result.file_changed).toBe(true);
+            expect(result.content).toBe(HYBRID_MD);
+            expect(result.startLine).toBe(0);
+        });
+
         it('should move document to after workbook', () => {
             // Move Doc Zero (index 0) to after workbook
             const result = moveDocumentSection(0, null, true, false);
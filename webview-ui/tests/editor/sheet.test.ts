@@ -14,7 +14,9 @@ import {
     deleteSheet,
     renameSheet,
     updateSheetMetadata,
-    moveSheet
+    moveSheet,
+    updateWorkbookTabOrder,
+    getEditorContext
 } from '../../../src/editor';
 
 const SAMPLE_CONFIG = JSON.stringify({
@@ -247,6 +249,22 @@ describe('Sheet Service Tests', () => {
                 expect(indices).toEqual([0, 1]);
             }
         });
+
+        it('should leave the previous tab_order entries untouched', () => {
+            addSheet('Sheet 3');
+            updateWorkbookTabOrder([
+                { type: 'sheet', index: 2 },
+                { type: 'sheet', index: 0 },
+                { type: 'sheet', index: 1 }
+            ]);
+            const previousOrder = getEditorContext().workbook!.metadata!.tab_order;
+            const snapshot = JSON.parse(JSON.stringify(previousOrder));
+
+            const result = deleteSheet(0);
+            expect(result.error).toBeUndefined();
+
+            expect(previousOrder).toEqual(snapshot);
+        });
     });
 
     // =========================================================================
@@ -16,6 +16,7 @@ import {
     updateTableMetadata,
     updateVisualMetadata,
     updateCell,
+    updateCells,
     insertRow,
     deleteRows,
     moveRows,
@@ -27,7 +28,8 @@ import {
     updateColumnWidth,
     updateColumnFormat,
     updateColumnFilter,
-    updateColumnAlign
+    updateColumnAlign,
+    updateColumnsBulk
 } from '../../../src/editor';
 
 const SAMPLE_CONFIG = JSON.stringify({
@@ -190,6 +192,21 @@ describe('Table Service Tests', () => {
             expect(state.workbook.sheets[0].tables[0].headers[1]).toBe('Header\\|With\\|Pipes');
         });
 
+        it('should update several cells in one call', () => {
+            const result = updateCells(0, 0, [
+                { rowIdx: -1, colIdx: 0, value: 'Key' },
+                { rowIdx: 0, colIdx: 1, value: 'a|b' },
+                { rowIdx: 3, colIdx: 0, value: 'New' }
+            ]);
+            expect(result.error).toBeUndefined();
+
+            const table = JSON.parse(getState()).workbook.sheets[0].tables[0];
+            expect(table.headers[0]).toBe('Key');
+            expect(table.rows[0][1]).toBe('a\\|b');
+            expect(table.rows.length).toBe(4);
+            expect(table.rows[3][0]).toBe('New');
+        });
+
         it('should return error for invalid column index on header edit', () => {
             const result = updateCell(0, 0, -1, 99, 'Invalid');
             expect(result.error).toBeDefined();
@@ -245,6 +262,15 @@ describe('Table Service Tests', () => {
             expect(rows.length).toBe(2);
         });
 
+        it('should delete each row once when indices repeat', () => {
+            const result = deleteRows(0, 0, [0, 0]);
+            expect(result.error).toBeUndefined();
+
+            const state = JSON.parse(getState());
+            const rows = state.workbook.sheets[0].tables[0].rows;
+            expect(rows).toEqual([['4', '5', '6']]);
+        });
+
         it('should move rows down', () => {
             const result = moveRows(0, 0, [0], 2);
             expect(result.error).toBeUndefined();
@@ -288,6 +314,18 @@ describe('Table Service Tests', () => {
             expect(rows[0][0]).toBe('4');
             expect(rows[1][0]).toBe('1');
         });
+
+        it('should re-infer the column type after a cell edit', () => {
+            sortRows(0, 0, 0, true);
+            updateCell(0, 0, 0, 0, 'abc');
+            sortRows(0, 0, 0, true);
+
+            const state = JSON.parse(getState());
+            const rows = state.workbook.sheets[0].tables[0].rows;
+            // Column is now text, so '4' sorts before 'abc'
+            expect(rows[0][0]).toBe('4');
+            expect(rows[1][0]).toBe('abc');
+        });
     });
 
     // =========================================================================
@@ -398,6 +436,28 @@ describe('Table Service Tests', () => {
             const table = state.workbook.sheets[0].tables[0];
             expect(table.alignments[0]).toBe('center');
         });
+
+        it('should update several columns in one bulk call', () => {
+            updateColumnWidth(0, 0, 2, 80);
+            const result = updateColumnsBulk(0, 0, {
+                widths: { 0: 120, 1: 90 },
+                formats: { 0: { type: 'currency', prefix: '$' } },
+                filters: { 1: ['2'] },
+                aligns: { 2: 'right' }
+            });
+            expect(result.error).toBeUndefined();
+
+            const state = JSON.parse(getState());
+            const table = state.workbook.sheets[0].tables[0];
+            expect(table.metadata.visual.columns['0']).toEqual({
+                width: 120,
+                format: { type: 'currency', prefix: '$' }
+            });
+            expect(table.metadata.visual.columns['1']).toEqual({ width: 90 });
+            expect(table.metadata.visual.columns['2']).toEqual({ width: 80 });
+            expect(table.metadata.visual.filters['1']).toEqual(['2']);
+            expect(table.alignments).toEqual(['left', 'left', 'right']);
+        });
     });
 
     // =========================================================================
@@ -0,0 +1,92 @@
+/**
+ * Regression test for in-place document moves during tab reorder
+ *
+ * Bug: When a tab reorder needs both a tab_order update and a document move,
+ * and the document is already where the move would put it, nothing was posted.
+ * The executor writes tab_order first without posting and relies on the move
+ * result to carry the regenerated workbook section, so the new tab_order never
+ * reached the file.
+ */
+import { describe, it, expect, beforeEach } from 'vitest';
+import * as editor from '../../../src/editor';
+import { TabReorderExecutor, type TabInfo } from '../../executors/tab-reorder-executor';
+import type { TabOrderItem } from '../../services/tab-reorder-service';
+
+const CONFIG = JSON.stringify({ rootMarker: '# Tables' });
+
+const MD = `# Doc A
+
+A
+
+# Tables
+
+## S1
+
+| a |
+|---|
+| 1 |
+
+## S2
+
+| b |
+|---|
+| 2 |
+
+# Doc B
+
+B
+
+# Doc C
+
+C
+`;
+
+describe('Regression: in-place document move with tab_order update', () => {
+    beforeEach(() => {
+        editor.resetContext();
+        editor.initializeWorkbook(MD, CONFIG);
+    });
+
+    it('should post the new tab_order when the dragged document is already first after the workbook', () => {
+        // Visual order [D0, D1, S0, S1, D2]; Doc B (D1) is physically first after the workbook
+        const tabOrder: TabOrderItem[] = [
+            { type: 'document', index: 0 },
+            { type: 'document', index: 1 },
+            { type: 'sheet', index: 0 },
+            { type: 'sheet', index: 1 },
+            { type: 'document', index: 2 }
+        ];
+        editor.updateWorkbookTabOrder(tabOrder);
+        const tabs: TabInfo[] = tabOrder.map((item) =>
+            item.type === 'sheet'
+                ? { type: 'sheet', sheetIndex: item.index }
+                : { type: 'document', docIndex: item.index }
+        );
+
+        const posted: { content?: string; startLine?: number; endLine?: number }[] = [];
+
+        // Drag D1 between S0 and S1: a toAfterWorkbook move that lands in place
+        const result = TabReorderExecutor.execute(tabs, 1, 3, {
+            postBatchUpdate: (update) => posted.push(update),
+            reorderTabsArray: () => {},
+            getCurrentTabOrder: () => tabOrder
+        });
+
+        expect(result.success).toBe(true);
+
+        const expectedOrder = [
+            { type: 'document', index: 0 },
+            { type: 'sheet', index: 0 },
+            { type: 'document', index: 1 },
+            { type: 'sheet', index: 1 },
+            { type: 'document', index: 2 }
+        ];
+        const state = JSON.parse(editor.getState());
+        expect(state.workbook.metadata.tab_order).toEqual(expectedOrder);
+
+        // The host must receive the same tab_order the editor now holds
+        expect(posted.length).toBe(1);
+        expect(posted[0].content).toContain(JSON.stringify({ tab_order: expectedOrder }));
+        expect(posted[0].content).toContain('# Doc B');
+    });
+});
@@ -83,6 +83,30 @@ describe('SpreadsheetService (TypeScript)', () => {
             expect(call.startLine).toBeDefined();
         });
 
+        it('should update every cell of a multi-cell range in one message', async () => {
+            service.updateRange(0, 0, 0, 1, 0, 1, 'X');
+
+            const calls = (mockVscode.postMessage as ReturnType<typeof vi.fn>).mock.calls;
+            expect(calls.length).toBe(1);
+            expect(calls[0][0].type).toBe('updateRange');
+
+            const rows = service.getCurrentWorkbook()!.sheets[0].tables[0].rows;
+            expect(rows).toEqual([
+                ['X', 'X'],
+                ['X', 'X']
+            ]);
+        });
+
+        it('should skip header cells past the last column but apply the rest of the range', async () => {
+            service.updateRange(0, 0, -1, 0, 1, 2, 'X');
+
+            expect(mockVscode.postMessage).toHaveBeenCalledTimes(1);
+
+            const table = service.getCurrentWorkbook()!.sheets[0].tables[0];
+            expect(table.headers).toEqual(['Name', 'X']);
+            expect(table.rows[0]).toEqual(['Apple', 'X', 'X']);
+        });
+
         it('should post message when adding a table', async () => {
             service.addTable(0, 'New Table');
 